@@ -1,12 +1,22 @@
+import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.routes import auth, interview
 from app.models import Base
-from app.database import engine
-from app.routes.interview import load_question_generator
-from app.ml_scoring import score_answer
+from app.database import engine, async_engine, ping_database_async, pool_status
+from app.ml_scoring import score_answer, EMBEDDING_CACHE
+from app.model_registry import (
+    model_stats, warmup, start_background_warmup, mark_warm, warmup_status, is_warm,
+    SENTENCE_MODEL, QUESTION_MODEL, SCORING_MODEL
+)
+from app.config import MODEL_WARMUP
+from app.services.inference import INFERENCE
+from app.utils.answer_bank import ANSWER_BANK
+from app.services.resume_extraction import shutdown_pool
 
-Base.metadata.create_all(bind=engine)
+WARMUP_MODELS = [SENTENCE_MODEL, QUESTION_MODEL, SCORING_MODEL]
+STARTED_AT = time.time()
 
 app = FastAPI(title="AI Interview Simulator", version="1.0.0")
 
@@ -28,13 +38,81 @@ def read_root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy", "database": "connected"}
+    """
+    Liveness: the process is up and serving requests. Says nothing about
+    models or the database; see /ready.
+    """
+    return {
+        "status": "alive",
+        "uptime_seconds": round(time.time() - STARTED_AT, 1),
+        "warmup": warmup_status()["state"],
+        "inference_pending": INFERENCE.pending
+    }
+
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness: warmup has finished and the database answers a ping.
+    """
+    checks = {"models": is_warm(), "database": False}
+    try:
+        await ping_database_async()
+        checks["database"] = True
+    except Exception as e:
+        print("READINESS DB ERROR:", e)
+
+    ready = all(checks.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "checks": checks,
+            "warmup": warmup_status(),
+            "db_pool": pool_status()
+        }
+    )
+
+@app.get("/models")
+def loaded_models():
+    return {**model_stats(), "inference_pending": INFERENCE.pending}
 
 @app.get("/dashboard")
 def dashboard():
     return {"message": "This is the dashboard endpoint."}
 
+def warm_inference():
+    score_answer("test Answer", "test ideal answer")
+
+@app.on_event("startup")
+def create_tables():
+    try:
+        Base.metadata.create_all(bind=engine)
+    except Exception as e:
+        # keep the worker alive; /ready reports the database as down
+        print("CREATE TABLES ERROR:", e)
+
+@app.on_event("startup")
+def load_answer_bank():
+    if ANSWER_BANK.load():
+        print(f"Loaded {len(ANSWER_BANK)} precomputed ideal answers")
+
 @app.on_event("startup")
 def warmup_models():
-    load_question_generator()
-    score_answer("test Answer", "test ideal answer")
\ No newline at end of file
+    if MODEL_WARMUP == "blocking":
+        warmup(WARMUP_MODELS)
+        warm_inference()
+        mark_warm(WARMUP_MODELS)
+    elif MODEL_WARMUP == "lazy":
+        mark_warm([])
+    else:
+        start_background_warmup(WARMUP_MODELS, after=warm_inference)
+
+@app.on_event("shutdown")
+def flush_caches():
+    INFERENCE.shutdown()
+    shutdown_pool()
+    EMBEDDING_CACHE.flush()
+
+@app.on_event("shutdown")
+async def close_database():
+    await async_engine.dispose()
@@ -1,26 +1,106 @@
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
+from app.ml_scoring import EMBEDDING_CACHE, encode_texts
+from app.utils.resume_category import detect_resume_category as detect_by_keywords
 
-model = SentenceTransformer('all-MiniLM-L6-v2')
+CHUNK_WORDS = 180
+MAX_CHUNKS = 16
 
-CATEGORIES = {
-    "IT": "software developer programming python java backend frontend database cloud devops",
-    "HR": "human resources recruitment hiring payroll employee relations hr policies onboarding",
-    "Managerial": "project management leadership strategy operations planning budgeting team lead"
+CATEGORY_PROTOTYPES = {
+    "IT": [
+        "software developer programming python java backend frontend database cloud devops",
+        "built and deployed web applications, REST APIs and microservices",
+        "machine learning engineer training models, data pipelines and analytics",
+        "infrastructure automation with docker, kubernetes, aws and ci/cd"
+    ],
+    "HR": [
+        "human resources recruitment hiring payroll employee relations hr policies onboarding",
+        "talent acquisition, interviewing candidates and managing the hiring pipeline",
+        "employee engagement, performance reviews, training and compliance"
+    ],
+    "Managerial": [
+        "project management leadership strategy operations planning budgeting team lead",
+        "managed cross-functional teams, stakeholders and delivery timelines",
+        "business operations, resource allocation and organizational growth"
+    ]
 }
 
-categories_embeddings = {
-    k: model.encode(v) for k, v in CATEGORIES.items()
-}
+
+def chunk_text(text: str, chunk_words: int = CHUNK_WORDS, max_chunks: int = MAX_CHUNKS) -> list:
+    words = text.split()
+    chunks = [
+        " ".join(words[start:start + chunk_words])
+        for start in range(0, len(words), chunk_words)
+    ]
+    return chunks[:max_chunks] or [text]
+
+
+class PrototypeClassifier:
+    """
+    Nearest-prototype classifier over sentence embeddings.
+    Every prototype of every category is a row of one normalized matrix, so
+    scoring a resume is a single matrix-vector product; a category's score
+    is its best prototype's cosine similarity.
+    """
+
+    def __init__(self, prototypes: dict):
+        self.categories = list(prototypes)
+        self.texts = [text for texts in prototypes.values() for text in texts]
+        self.labels = np.array([
+            index
+            for index, texts in enumerate(prototypes.values())
+            for _ in texts
+        ])
+        self._matrix = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        if self._matrix is None:
+            vectors = EMBEDDING_CACHE.encode(self.texts, encode_texts)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            self._matrix = vectors / np.maximum(norms, 1e-12)
+        return self._matrix
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Encodes the resume as one batch of word chunks and returns their
+        length-weighted mean, normalized, so long resumes are not truncated
+        at the encoder's sequence limit.
+        """
+        chunks = chunk_text(text)
+        vectors = encode_texts(chunks)
+        weights = np.array([len(chunk.split()) for chunk in chunks], dtype=np.float32)
+        embedding = (vectors * weights[:, None]).sum(axis=0)
+        return (embedding / max(np.linalg.norm(embedding), 1e-12)).astype(np.float32)
+
+    def scores(self, embedding: np.ndarray) -> np.ndarray:
+        similarities = self.matrix @ embedding
+        scores = np.full(len(self.categories), -1.0, dtype=np.float32)
+        np.maximum.at(scores, self.labels, similarities)
+        return scores
+
+    def classify(self, text: str, embedding=None):
+        """
+        Returns (category, confidence, embedding); confidence is the
+        winning category's cosine similarity.
+        """
+        if embedding is None:
+            embedding = self.embed(text)
+        scores = self.scores(embedding)
+        best = int(np.argmax(scores))
+        return self.categories[best], float(scores[best]), embedding
+
+
+CLASSIFIER = PrototypeClassifier(CATEGORY_PROTOTYPES)
+
+def classify_resume(text: str, min_confidence: float, embedding=None):
+    """
+    Returns (category, method, embedding). Falls back to the keyword
+    detector when the embedding classifier is not confident enough.
+    """
+    category, confidence, embedding = CLASSIFIER.classify(text, embedding)
+    if confidence >= min_confidence:
+        return category, "embedding", embedding
+    return detect_by_keywords(text), "keywords", embedding
 
 def detect_resume_category(resume_text: str) -> str:
-    resume_embedding = model.encode(resume_text)
-    
-    scores = {
-        cat: cosine_similarity(
-            [resume_embedding], [emb]
-        ) [0] [0]
-        for cat, emb in categories_embeddings.items()
-    }
-    
-    return max(scores, key=scores.get)
\ No newline at end of file
+    return CLASSIFIER.classify(resume_text)[0]
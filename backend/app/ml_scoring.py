@@ -1,7 +1,20 @@
+import json
 import re
-from sentence_transformers import SentenceTransformer, util
+import threading
+import numpy as np
+from app.config import (
+    EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_MMAP, EMBEDDING_CACHE_MAX_ENTRIES,
+    SCORER_BACKEND, SCORING_WEIGHTS_PATH
+)
+from app.model_registry import get_model, SENTENCE_MODEL
+from app.utils.answer_bank import ANSWER_BANK
+from app.utils.embedding_cache import EmbeddingCache
 
-model = SentenceTransformer("all-MiniLM-L6-v2")
+EMBEDDING_CACHE = EmbeddingCache(
+    EMBEDDING_CACHE_PATH,
+    mmap=EMBEDDING_CACHE_MMAP,
+    max_entries=EMBEDDING_CACHE_MAX_ENTRIES
+)
 
 MAX_SCORE_PER_QUESTION = 10
 MIN_SIMILARITY = 0.35
@@ -12,24 +25,14 @@ def clean_text(text: str) -> str:
     text = re.sub(r"[^a-z0-9\s]", "", text)
     return text.strip()
 
-def score_answer(user_answer: str, ideal_answer: str) -> dict:
-    user_answer = clean_text(user_answer)
-    ideal_answer = clean_text(ideal_answer)
-
-    words = len(user_answer.split())
-
-    
-    if words < MIN_WORDS:
-        return {
-            "score": 0,
-            "why_lost": ["Answer too short"],
-            "breakdown": {"technical": 0, "clarity": 0, "communication": 0}
-        }
-
-    user_emb = model.encode(user_answer, convert_to_tensor=True)
-    ideal_emb = model.encode(ideal_answer, convert_to_tensor=True)
-    similarity = util.cos_sim(user_emb, ideal_emb).item()
+def too_short_result() -> dict:
+    return {
+        "score": 0,
+        "why_lost": ["Answer too short"],
+        "breakdown": {"technical": 0, "clarity": 0, "communication": 0}
+    }
 
+def score_from_similarity(similarity: float, words: int) -> dict:
     if similarity < MIN_SIMILARITY:
         return {
             "score": 2,
@@ -37,7 +40,7 @@ def score_answer(user_answer: str, ideal_answer: str) -> dict:
             "breakdown": {"technical": 2, "clarity": 1, "communication": 1}
         }
 
-    
+
     technical = min(10, int(similarity * 10))
     communication = min(10, max(4, words // 20))
     clarity = min(10, int(similarity * 8))
@@ -64,3 +67,174 @@ def score_answer(user_answer: str, ideal_answer: str) -> dict:
         },
         "why_lost": why_lost or ["Good balanced answer"]
     }
+
+def score_from_regression(similarity: float, words: int, predicted: float) -> dict:
+    """
+    The regression model only sees the answer, so off-topic answers keep
+    the relevance penalty; otherwise its 0-100 prediction replaces the
+    heuristic score on the per-question 0-10 scale.
+    """
+    result = score_from_similarity(similarity, words)
+    if similarity >= MIN_SIMILARITY:
+        result["score"] = min(MAX_SCORE_PER_QUESTION, max(0, int(round(predicted / 10))))
+    return result
+
+REGRESSION_FEATURE = "token_mean"
+REGRESSION_PREPROCESSING = {
+    # ai_model/interview_score_model.ipynb: weights saved without metadata,
+    # fitted on the answer exactly as written
+    "raw": lambda text: text,
+    # app/training/train_scorer.py
+    "clean_text": clean_text,
+}
+
+class RegressionScorer:
+    """
+    Linear model over the unnormalized mean of MiniLM token embeddings,
+    predicting a 0-100 score. Loaded once; predict() is one matrix-vector
+    product.
+    Artifacts from app/training/train_scorer.py record their encoder,
+    feature and preprocessing in metadata; the original notebook weights
+    have none and are treated as raw-text token means. Weights whose
+    metadata does not match what serving computes are refused.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._weights = None
+        self._bias = 0.0
+        self.metadata = {}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._weights is None:
+                with np.load(self.path) as data:
+                    metadata = json.loads(str(data["metadata"])) if "metadata" in data.files else {}
+                    self._check(metadata)
+                    self._bias = float(data["bias"])
+                    self._weights = np.asarray(data["weights"], dtype=np.float32).ravel()
+                    self.metadata = metadata
+        return self._weights
+
+    def _check(self, metadata: dict):
+        expected = {
+            "encoder": SENTENCE_MODEL,
+            "feature": REGRESSION_FEATURE,
+        }
+        for key, value in expected.items():
+            if metadata.get(key, value) != value:
+                raise ValueError(
+                    f"{self.path} was trained with {key}={metadata[key]!r}, serving uses {value!r}"
+                )
+        if metadata.get("preprocessing", "raw") not in REGRESSION_PREPROCESSING:
+            raise ValueError(f"{self.path} has unknown preprocessing {metadata['preprocessing']!r}")
+
+    @property
+    def preprocessing(self) -> str:
+        if self._weights is None:
+            self._load()
+        return self.metadata.get("preprocessing", "raw")
+
+    def prepare(self, answer: str) -> str:
+        """
+        The answer text as the model was trained on it.
+        """
+        return REGRESSION_PREPROCESSING[self.preprocessing](answer)
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        weights = self._weights if self._weights is not None else self._load()
+        return np.clip(np.asarray(features, dtype=np.float32) @ weights + self._bias, 0, 100)
+
+REGRESSION_SCORER = RegressionScorer(SCORING_WEIGHTS_PATH)
+
+def encode_texts(texts) -> np.ndarray:
+    model = get_model(SENTENCE_MODEL)
+    return model.encode(list(texts), normalize_embeddings=True, convert_to_numpy=True)
+
+def _as_array(value) -> np.ndarray:
+    if hasattr(value, "cpu"):
+        value = value.float().cpu().numpy()
+    return np.asarray(value, dtype=np.float32)
+
+def encode_with_token_means(texts, model=None):
+    """
+    Returns (normalized sentence embeddings, mean-pooled token embeddings)
+    from a single encoder pass; the latter are the regression features.
+    """
+    model = model or get_model(SENTENCE_MODEL)
+    outputs = model.encode(list(texts), output_value=None)
+
+    sentences, features = [], []
+    for output in outputs:
+        tokens = _as_array(output["token_embeddings"])
+        mask = _as_array(output["attention_mask"])[:, None]
+        features.append((tokens * mask).sum(axis=0) / max(mask.sum(), 1.0))
+        sentences.append(_as_array(output["sentence_embedding"]))
+
+    sentences = np.stack(sentences)
+    sentences /= np.maximum(np.linalg.norm(sentences, axis=1, keepdims=True), 1e-12)
+    return sentences, np.stack(features)
+
+def score_answer(user_answer: str, ideal_answer: str) -> dict:
+    return score_answers([(user_answer, ideal_answer)])[0]
+
+def score_answers(pairs, backend: str = SCORER_BACKEND) -> list[dict]:
+    """
+    Scores (user_answer, ideal_answer) pairs in one encoder pass.
+    Ideal answer embeddings come from EMBEDDING_CACHE when known; user
+    answers and any uncached ideal answers are encoded together as a single
+    padded batch and only the pairwise (diagonal) similarities are computed.
+    With the "regression" backend the token embeddings fed to
+    REGRESSION_SCORER come from the same pass when the model was trained on
+    cleaned text, and from a second pass over the raw answers otherwise.
+    """
+    cleaned = [(clean_text(u), clean_text(i)) for u, i in pairs]
+    results = [None] * len(cleaned)
+
+    pending = []
+    for idx, (user_answer, ideal_answer) in enumerate(cleaned):
+        if len(user_answer.split()) < MIN_WORDS:
+            results[idx] = too_short_result()
+        else:
+            pending.append(idx)
+
+    if pending:
+        user_texts = [cleaned[idx][0] for idx in pending]
+        ideal_texts = [cleaned[idx][1] for idx in pending]
+
+        ideal_embs, missing = EMBEDDING_CACHE.lookup(ideal_texts)
+        ideal_embs, missing = ANSWER_BANK.fill_embeddings(ideal_texts, ideal_embs, missing)
+        missing_texts = list(dict.fromkeys(ideal_texts[i] for i in missing))
+
+        if backend == "regression" and REGRESSION_SCORER.preprocessing == "clean_text":
+            embeddings, features = encode_with_token_means(user_texts + missing_texts)
+            predicted = REGRESSION_SCORER.predict(features[:len(user_texts)]).tolist()
+        elif backend == "regression":
+            # the features are built from differently prepared text than the
+            # similarity embeddings, so they need their own pass
+            embeddings = encode_texts(user_texts + missing_texts)
+            _, features = encode_with_token_means([REGRESSION_SCORER.prepare(pairs[idx][0]) for idx in pending])
+            predicted = REGRESSION_SCORER.predict(features).tolist()
+        else:
+            embeddings = encode_texts(user_texts + missing_texts)
+        user_embs = embeddings[:len(user_texts)]
+
+        if missing_texts:
+            fresh = dict(zip(missing_texts, embeddings[len(user_texts):]))
+            EMBEDDING_CACHE.store(missing_texts, embeddings[len(user_texts):])
+            if ideal_embs is None:
+                ideal_embs = np.zeros_like(user_embs)
+            for i in missing:
+                ideal_embs[i] = fresh[ideal_texts[i]]
+
+        similarities = np.einsum("ij,ij->i", user_embs, ideal_embs).tolist()
+
+        for row, (idx, similarity) in enumerate(zip(pending, similarities)):
+            words = len(cleaned[idx][0].split())
+            if backend == "regression":
+                results[idx] = score_from_regression(similarity, words, predicted[row])
+            else:
+                results[idx] = score_from_similarity(similarity, words)
+
+    return results
@@ -0,0 +1,162 @@
+import os
+import threading
+import time
+from app.config import INFERENCE_BACKEND
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+SENTENCE_MODEL = "all-MiniLM-L6-v2"
+QUESTION_MODEL = "google/flan-t5-base"
+SCORING_MODEL = "google/flan-t5-small"
+QUESTION_GENERATION_MODEL = "mrm8488/t5-base-finetuned-question-generation-ap"
+
+
+def _load_sentence_transformer(name: str, backend: str = INFERENCE_BACKEND):
+    if backend == "onnx":
+        from app.onnx_models import load_sentence_transformer
+        return load_sentence_transformer(name)
+
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(name)
+
+
+def _load_text2text(name: str, backend: str = INFERENCE_BACKEND):
+    if backend == "onnx":
+        from app.onnx_models import load_text2text
+        return load_text2text(name)
+
+    from transformers import pipeline
+    return pipeline("text2text-generation", model=name, device=-1)
+
+
+LOADERS = {
+    SENTENCE_MODEL: _load_sentence_transformer,
+    QUESTION_MODEL: _load_text2text,
+    SCORING_MODEL: _load_text2text,
+    QUESTION_GENERATION_MODEL: _load_text2text,
+}
+
+_models = {}
+_stats = {}
+_warmup = {"state": "idle", "models": [], "error": None, "seconds": None, "attempts": 0}
+WARMUP_RETRY_INITIAL_SECONDS = 1
+WARMUP_RETRY_MAX_SECONDS = 60
+_registry_lock = threading.Lock()
+_model_locks = {}
+
+
+def _rss_bytes():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def get_model(name: str):
+    """
+    Returns the process-wide instance of a registered model, loading it on
+    first use. Concurrent first calls for the same model load it once.
+    """
+    model = _models.get(name)
+    if model is not None:
+        return model
+
+    if name not in LOADERS:
+        raise KeyError(f"Unknown model: {name}")
+
+    with _registry_lock:
+        lock = _model_locks.setdefault(name, threading.Lock())
+
+    with lock:
+        model = _models.get(name)
+        if model is not None:
+            return model
+
+        rss_before = _rss_bytes()
+        started = time.perf_counter()
+        model = LOADERS[name](name)
+        load_seconds = time.perf_counter() - started
+        rss_after = _rss_bytes()
+
+        _stats[name] = {
+            "load_seconds": round(load_seconds, 3),
+            "rss_delta_mb": (
+                round((rss_after - rss_before) / 2**20, 1)
+                if rss_before is not None and rss_after is not None else None
+            ),
+            "loaded_at": time.time(),
+        }
+        _models[name] = model
+        return model
+
+
+def warmup(names=None):
+    for name in names or LOADERS:
+        get_model(name)
+
+
+def start_background_warmup(names, after=None) -> threading.Thread:
+    """
+    Loads the given models on a daemon thread, then runs after() (e.g. a
+    dummy inference), so the process can accept connections immediately.
+    A failed attempt (e.g. a download error) is retried with exponential
+    backoff until it succeeds; models loaded by an earlier attempt are
+    kept. Progress is reported by warmup_status().
+    """
+    def run():
+        started = time.perf_counter()
+        delay = WARMUP_RETRY_INITIAL_SECONDS
+        while True:
+            _warmup["attempts"] += 1
+            try:
+                warmup(names)
+                if after is not None:
+                    after()
+            except Exception as e:
+                print(f"MODEL WARMUP ERROR (retrying in {delay}s):", e)
+                _warmup.update(state="failed", error=str(e))
+                time.sleep(delay)
+                delay = min(delay * 2, WARMUP_RETRY_MAX_SECONDS)
+                _warmup["state"] = "warming"
+            else:
+                _warmup.update(state="ready", error=None)
+                break
+        _warmup["seconds"] = round(time.perf_counter() - started, 3)
+
+    _warmup.update(state="warming", models=list(names), error=None, seconds=None, attempts=0)
+    thread = threading.Thread(target=run, name="model-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def mark_warm(names):
+    _warmup.update(state="ready", models=list(names), error=None)
+
+
+def warmup_status() -> dict:
+    return {
+        **_warmup,
+        "loaded": [name for name in _warmup["models"] if name in _models],
+    }
+
+
+def is_warm() -> bool:
+    return _warmup["state"] == "ready" and all(name in _models for name in _warmup["models"])
+
+
+def model_stats() -> dict:
+    rss = _rss_bytes()
+    return {
+        "backend": INFERENCE_BACKEND,
+        "process_rss_mb": round(rss / 2**20, 1) if rss is not None else None,
+        "models": {
+            name: {"loaded": name in _models, **_stats.get(name, {})}
+            for name in LOADERS
+        }
+    }
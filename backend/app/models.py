@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, JSON
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, Boolean, JSON, Index, ForeignKey
 from sqlalchemy.orm import declarative_base
 from datetime import datetime
 
@@ -15,17 +15,62 @@ class User(Base):
     is_active = Column(Boolean, default=True)
 
 
+class Resume(Base):
+    __tablename__ = "resumes"
+
+    id = Column(Integer, primary_key=True)
+    content_hash = Column(String(64), nullable=False, unique=True)
+    text = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 class InterviewSession(Base):
     __tablename__ = "interview_sessions"
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, index=True, nullable=False)
-    resume_text = Column(String, nullable=False)
+    resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=True, index=True)
     resume_category = Column(String, nullable=True)   
     generated_questions = Column(JSON, nullable=False)
     interviewer_personality = Column(String, default="technical")
-    user_answers = Column(JSON, default=list)  
-    feedback = Column(JSON, default=dict)     
     score = Column(Integer, nullable=True)
-    asked_questions = Column(JSON, default=list)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_interview_sessions_user_created", "user_id", "created_at"),
+    )
+
+
+class SessionAnswer(Base):
+    __tablename__ = "session_answers"
+
+    id = Column(Integer, primary_key=True)
+    session_id = Column(Integer, ForeignKey("interview_sessions.id", ondelete="CASCADE"), nullable=False)
+    position = Column(Integer, nullable=False)
+    question = Column(Text, nullable=False)
+    answer = Column(Text, nullable=False)
+    score = Column(Integer, nullable=True)
+    technical = Column(Integer, nullable=True)
+    clarity = Column(Integer, nullable=True)
+    communication = Column(Integer, nullable=True)
+    why_lost = Column(JSON, nullable=True)
+    followup_question = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_session_answers_session_position", "session_id", "position", unique=True),
+    )
+
+
+class AskedQuestion(Base):
+    __tablename__ = "asked_questions"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    question_hash = Column(BigInteger, nullable=False)
+    session_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_asked_questions_user_hash", "user_id", "question_hash", unique=True),
+    )
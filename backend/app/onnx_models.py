@@ -0,0 +1,212 @@
+"""
+ONNX Runtime versions of the registry models (INFERENCE_BACKEND=onnx).
+Each model is exported once into ONNX_MODEL_DIR, dynamically quantized to
+int8 unless ONNX_QUANTIZATION is empty, and loaded behind the same
+interface as its PyTorch counterpart: a SentenceTransformer for MiniLM and
+a text2text-generation pipeline for flan-t5.
+Needs optimum[onnxruntime] and sentence-transformers>=3.2.
+
+    python -m app.onnx_models            # export, then check parity with PyTorch
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import time
+from app.config import BASE_DIR, ONNX_MODEL_DIR, ONNX_QUANTIZATION
+
+PARITY_DATA_PATH = os.path.join(os.path.dirname(BASE_DIR), "ai_model", "training_data.jsonl")
+PARITY_LIMIT = 64
+PARITY_MIN_COSINE = 0.98
+PARITY_MAX_SCORE_DIFF = 1
+
+
+def model_dir(name: str, quantized: bool = False) -> str:
+    suffix = f"-{ONNX_QUANTIZATION}" if quantized else ""
+    return os.path.join(ONNX_MODEL_DIR, name.replace("/", "--") + suffix)
+
+
+def _quantization_config():
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    return getattr(AutoQuantizationConfig, ONNX_QUANTIZATION)(is_static=False, per_channel=False)
+
+
+def export_sentence_transformer(name: str) -> tuple:
+    """
+    Returns (directory, onnx file name relative to it).
+    """
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+    directory = model_dir(name)
+    plain = os.path.join("onnx", "model.onnx")
+    if not os.path.exists(os.path.join(directory, plain)):
+        SentenceTransformer(name, backend="onnx").save_pretrained(directory)
+
+    if not ONNX_QUANTIZATION:
+        return directory, plain
+
+    quantized = os.path.join("onnx", f"model_qint8_{ONNX_QUANTIZATION}.onnx")
+    if not os.path.exists(os.path.join(directory, quantized)):
+        model = SentenceTransformer(directory, backend="onnx", model_kwargs={"file_name": plain})
+        export_dynamic_quantized_onnx_model(model, ONNX_QUANTIZATION, directory)
+    return directory, quantized
+
+
+def load_sentence_transformer(name: str):
+    from sentence_transformers import SentenceTransformer
+
+    directory, file_name = export_sentence_transformer(name)
+    return SentenceTransformer(directory, backend="onnx", model_kwargs={"file_name": file_name})
+
+
+def export_text2text(name: str) -> str:
+    """
+    Exports an encoder-decoder model and returns the directory holding the
+    (quantized) ONNX graphs, config and tokenizer.
+    """
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+    from transformers import AutoTokenizer
+
+    directory = model_dir(name)
+    if not glob.glob(os.path.join(directory, "encoder_model*.onnx")):
+        model = ORTModelForSeq2SeqLM.from_pretrained(name, export=True)
+        model.save_pretrained(directory)
+        AutoTokenizer.from_pretrained(name).save_pretrained(directory)
+
+    if not ONNX_QUANTIZATION:
+        return directory
+
+    quantized = model_dir(name, quantized=True)
+    if not glob.glob(os.path.join(quantized, "encoder_model*.onnx")):
+        for path in sorted(glob.glob(os.path.join(directory, "*.onnx"))):
+            quantizer = ORTQuantizer.from_pretrained(directory, file_name=os.path.basename(path))
+            quantizer.quantize(save_dir=quantized, quantization_config=_quantization_config())
+        for path in glob.glob(os.path.join(directory, "*.json")):
+            if not os.path.exists(os.path.join(quantized, os.path.basename(path))):
+                shutil.copy(path, quantized)
+        AutoTokenizer.from_pretrained(directory).save_pretrained(quantized)
+    return quantized
+
+
+def load_text2text(name: str):
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    from transformers import AutoTokenizer, pipeline
+
+    directory = export_text2text(name)
+    files = {
+        os.path.basename(path).replace("_quantized", "").rsplit(".", 1)[0]: os.path.basename(path)
+        for path in glob.glob(os.path.join(directory, "*.onnx"))
+    }
+    kwargs = {
+        f"{part}_file_name": files[graph]
+        for part, graph in (
+            ("encoder", "encoder_model"),
+            ("decoder", "decoder_model_merged" if "decoder_model_merged" in files else "decoder_model"),
+            ("decoder_with_past", "decoder_with_past_model"),
+        )
+        if graph in files
+    }
+
+    model = ORTModelForSeq2SeqLM.from_pretrained(directory, **kwargs)
+    tokenizer = AutoTokenizer.from_pretrained(directory)
+    return pipeline("text2text-generation", model=model, tokenizer=tokenizer, device=-1)
+
+
+def _timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def check_parity(data_path: str, limit: int, min_cosine: float, max_score_diff: int) -> bool:
+    """
+    Compares the ONNX models with the PyTorch ones on answers from a
+    scoring dataset. Fails if any embedding drifts below min_cosine or any
+    heuristic / regression score moves by more than max_score_diff points.
+    Generation is reported but not gated: quantized decoding may pick
+    different but equivalent wording.
+    """
+    import numpy as np
+    from app.ml_scoring import (
+        REGRESSION_SCORER, clean_text, encode_with_token_means,
+        score_from_regression, score_from_similarity
+    )
+    from app.model_registry import (
+        SENTENCE_MODEL, QUESTION_MODEL, SCORING_MODEL,
+        _load_sentence_transformer, _load_text2text
+    )
+
+    with open(data_path, encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f if line.strip()][:limit]
+    users = [clean_text(row["answer"]) for row in rows]
+    ideals = [clean_text(row["ideal_answer"]) for row in rows]
+
+    results = {}
+    for backend in ("torch", "onnx"):
+        model = _load_sentence_transformer(SENTENCE_MODEL, backend=backend)
+        (embeddings, features), seconds = _timed(encode_with_token_means, users + ideals, model)
+        similarities = np.einsum("ij,ij->i", embeddings[:len(users)], embeddings[len(users):])
+        scores = [score_from_similarity(s, len(u.split()))["score"] for s, u in zip(similarities, users)]
+        if os.path.exists(REGRESSION_SCORER.path):
+            if REGRESSION_SCORER.preprocessing != "clean_text":
+                _, features = encode_with_token_means(
+                    [REGRESSION_SCORER.prepare(row["answer"]) for row in rows], model
+                )
+            predicted = REGRESSION_SCORER.predict(features[:len(users)])
+            scores += [
+                score_from_regression(s, len(u.split()), p)["score"]
+                for s, u, p in zip(similarities, users, predicted)
+            ]
+        results[backend] = (embeddings, scores, seconds)
+
+    torch_embs, torch_scores, torch_seconds = results["torch"]
+    onnx_embs, onnx_scores, onnx_seconds = results["onnx"]
+    cosine = float(np.einsum("ij,ij->i", torch_embs, onnx_embs).min())
+    score_diff = max(abs(a - b) for a, b in zip(torch_scores, onnx_scores))
+    ok = cosine >= min_cosine and score_diff <= max_score_diff
+    print(
+        f"{SENTENCE_MODEL}: min cosine {cosine:.4f}, max score diff {score_diff}, "
+        f"torch {torch_seconds:.2f}s, onnx {onnx_seconds:.2f}s -> {'ok' if ok else 'FAIL'}"
+    )
+
+    prompts = [f"Provide a strong interview answer:\n{row['question']}" for row in rows]
+    for name in (SCORING_MODEL, QUESTION_MODEL):
+        outputs = {}
+        for backend in ("torch", "onnx"):
+            generator = _load_text2text(name, backend=backend)
+            generated, seconds = _timed(generator, prompts, max_length=128, do_sample=False)
+            outputs[backend] = ([item["generated_text"] for item in generated], seconds)
+        same = sum(a == b for a, b in zip(outputs["torch"][0], outputs["onnx"][0]))
+        print(
+            f"{name}: {same}/{len(prompts)} identical generations, "
+            f"torch {outputs['torch'][1]:.2f}s, onnx {outputs['onnx'][1]:.2f}s"
+        )
+
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the ONNX models and check parity with PyTorch.")
+    parser.add_argument("--data", default=PARITY_DATA_PATH)
+    parser.add_argument("--limit", type=int, default=PARITY_LIMIT)
+    parser.add_argument("--min-cosine", type=float, default=PARITY_MIN_COSINE)
+    parser.add_argument("--max-score-diff", type=int, default=PARITY_MAX_SCORE_DIFF)
+    parser.add_argument("--export-only", action="store_true")
+    args = parser.parse_args(argv)
+
+    from app.model_registry import SENTENCE_MODEL, QUESTION_MODEL, SCORING_MODEL
+
+    export_sentence_transformer(SENTENCE_MODEL)
+    for name in (SCORING_MODEL, QUESTION_MODEL):
+        export_text2text(name)
+    print(f"Exported models to {ONNX_MODEL_DIR}")
+
+    if not args.export_only and not check_parity(
+        args.data, args.limit, args.min_cosine, args.max_score_diff
+    ):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,18 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from passlib.context import CryptContext
-from app.database import SessionLocal
+from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models import User
 from pydantic import BaseModel, EmailStr
+from typing import Optional
 from app.utils.interviewer_state import get_reactions
+from app.utils.reaction_channel import REACTIONS
+from app.utils.sse import format_sse, KEEPALIVE
+from app.services.inference import InferenceOverloaded, InferenceTimeout
+from app.services.passwords import hash_password, verify_password
 
 router = APIRouter()
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
 class UserRegistration(BaseModel):
     email: EmailStr
@@ -18,26 +23,20 @@ class UserLogin(BaseModel):
     email: EmailStr
     password: str
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-def hash_password(password: str):
-    return pwd_context.hash(password)
 
-def verify_password(plain_password: str, hashed_password: str):
-    return pwd_context.verify(plain_password, hashed_password)
+async def run_password_task(fn, *args):
+    try:
+        return await fn(*args)
+    except (InferenceOverloaded, InferenceTimeout):
+        raise HTTPException(status_code=503, detail="Authentication is busy, try again shortly")
 
 @router.post("/register")
-async def register(user_data: UserRegistration, db: Session = Depends(get_db)):
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+async def register(user_data: UserRegistration, db: AsyncSession = Depends(get_async_db)):
+    existing_user = await db.scalar(select(User.id).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    hashed_pw = hash_password(user_data.password)
+    hashed_pw = await run_password_task(hash_password, user_data.password)
     
     new_user = User(
         email=user_data.email,
@@ -45,16 +44,25 @@ async def register(user_data: UserRegistration, db: Session = Depends(get_db)):
         full_name=user_data.full_name
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
     return {"message": "User registered successfully", "user_id": new_user.id}
 
 @router.post("/login")
-async def login(login_data: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == login_data.email).first()
-    if not user or not verify_password(login_data.password, user.hashed_password):
+async def login(login_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    user = (await db.execute(
+        select(User.id, User.hashed_password).where(User.email == login_data.email)
+    )).first()
+    if not user:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
+    valid, new_hash = await run_password_task(verify_password, login_data.password, user.hashed_password)
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+
+    if new_hash:
+        await db.execute(update(User).where(User.id == user.id).values(hashed_password=new_hash))
+        await db.commit()
+
     return {"message": "Login successful", "user_id": user.id}
 
 
@@ -63,3 +71,33 @@ def interviewer_reactions(session_id: int):
     return {
         "events": get_reactions(session_id)
     }
+
+
+@router.get("/interviewer-reactions/{session_id}/stream")
+async def interviewer_reactions_stream(session_id: int, last_event_id: Optional[str] = Header(None)):
+    """
+    Replays the session's reactions, then streams new ones. Each event
+    carries the reaction's seq as its id, so a reconnecting EventSource
+    (which sends Last-Event-ID) only receives what it has not seen.
+    """
+    sent = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+
+    async def event_stream():
+        nonlocal sent
+        async for reaction in REACTIONS.subscribe(session_id, replay=lambda: get_reactions(session_id)):
+            if reaction is None:
+                yield KEEPALIVE
+                continue
+
+            seq = reaction.get("seq")
+            if seq is not None:
+                if seq <= sent:
+                    continue
+                sent = seq
+            yield format_sse("reaction", reaction, event_id=seq)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,53 +1,62 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form
-from sqlalchemy.orm import Session
-from transformers import pipeline
-import PyPDF2
-import io
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from starlette.concurrency import run_in_threadpool
+from anyio import from_thread
+import asyncio
+import base64
+import hashlib
+import os
 import random
 from pydantic import BaseModel
-from app.database import SessionLocal
-from app.models import InterviewSession
-from app.ml_scoring import score_answer
+from typing import Optional
+from datetime import datetime
+from app.database import get_async_db, async_session_scope
+from app.models import InterviewSession, AskedQuestion, Resume, SessionAnswer
+from app.ml_scoring import score_answer, score_answers
+from app.ml_resume_category import classify_resume
+from app.model_registry import get_model, QUESTION_MODEL, SCORING_MODEL
+from app.config import SCORE_SESSION_TIMEOUT_SECONDS, RESUME_CLASSIFIER, RESUME_CLASSIFIER_MIN_CONFIDENCE
+from app.services.inference import INFERENCE, InferenceOverloaded, InferenceTimeout
+from app.services.generation_batcher import GenerationBatcher
+from app.services.resume_extraction import spool_upload, extract_spooled, ResumeRejected
+from app.services.scoring_jobs import create_job, get_job, expire_job_later
+from app.utils.sse import format_sse
 from app.utils.resume_category import detect_resume_category
-from app.utils.ideal_answer_cache import get_cached_ideal_answer, set_cached_ideal_answer
+from app.utils.keyword_matcher import KeywordMatcher
+from app.utils.resume_cache import RESUME_CACHE
+from app.utils.answer_bank import ANSWER_BANK
+from app.utils.ideal_answer_cache import get_cached_ideal_answer, set_cached_ideal_answer, ideal_cache_stats
 from app.utils.scoring_progress import init_progress, update_progress, get_progress, clear_progress
-from app.utils.interviewer_state import INTERVIEWER_STATE, init_interviewer, add_reaction, get_reactions, clear_reactions
-from app.utils.question_prompts import PROMPTS
-from app.utils.followup_prompts import FOLLOWUP_PROMPTS
-from app.utils.interviewer_personalities import INTERVIEWER_PERSONALITIES
+from app.utils.interviewer_state import init_interviewer, add_reaction, clear_reactions
+from app.utils.question_templates import QUESTION_ENGINE, PERSONALITY_TONES, question_fingerprint
 import re
 
 router = APIRouter()
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 
-question_model = None
-scoring_model = None
+async def run_inference(fn, *args, **kwargs):
+    try:
+        return await INFERENCE.run(fn, *args, **kwargs)
+    except InferenceOverloaded:
+        raise HTTPException(status_code=503, detail="Inference queue is full, try again shortly")
+    except InferenceTimeout:
+        raise HTTPException(status_code=504, detail="Inference timed out")
+
 
 def load_question_generator():
-    global question_model
-    if question_model is None:
-        question_model = pipeline(
-            "text2text-generation",
-            model="google/flan-t5-base",
-            device=-1
-        )
-    return question_model
+    return get_model(QUESTION_MODEL)
 
 def load_scoring_model():
-    global scoring_model
-    if scoring_model is None:
-        scoring_model = pipeline(
-            "text2text-generation",
-            model="google/flan-t5-small",
-            device=-1
-        )
-    return scoring_model
+    return get_model(SCORING_MODEL)
+
+
+IDEAL_ANSWER_PROMPT = "Provide a strong interview answer:\n{question}"
+IDEAL_ANSWER_BATCHER = GenerationBatcher(load_scoring_model, max_length=128)
+FOLLOWUP_BATCHER = GenerationBatcher(load_question_generator, max_length=64)
 
 
 def resolve_next_difficulty(score: int) -> str:
@@ -106,6 +115,28 @@ def is_bad_question(q: str) -> bool:
         )
 
     
+FALLBACK_SIGNALS = [
+    "Worked on real-world projects requiring problem-solving and decision-making",
+    "Handled responsibilities involving planning, execution, and improvement",
+    "Faced challenges while delivering outcomes under constraints",
+    "Collaborated with others to achieve project goals",
+    "Applied technical and analytical skills to practical tasks"
+]
+
+SIGNAL_MATCHER = KeywordMatcher({
+    "action": [
+        "developed", "designed", "built", "implemented", "created",
+        "led", "managed", "taught", "trained", "handled",
+        "optimized", "improved", "analyzed", "deployed",
+        "integrated", "tested", "maintained"
+    ],
+    "banned": [
+        "skills", "languages", "education", "certification",
+        "hobbies", "personal", "interests"
+    ],
+    "topic": ["project", "application", "system", "model", "website"],
+})
+
 def extract_experience_signals(text: str) -> list[str]:
     """
     Robust experience signal extractor for resumes
@@ -113,49 +144,29 @@ def extract_experience_signals(text: str) -> list[str]:
     """
     text = re.sub(r"\s+", " ", text)
     text = text.replace("•", ".").replace("-", ".")
-    
-    raw_lines = [l.strip() for l in re.split(r"[.\n]", text) if len(l.strip()) > 25]
-
-    action_verbs = [
-        "developed", "designed", "built", "implemented", "created",
-        "led", "managed", "taught", "trained", "handled",
-        "optimized", "improved", "analyzed", "deployed",
-        "integrated", "tested", "maintained"
-    ]
 
-    banned_sections = [
-        "skills", "languages", "education", "certification",
-        "hobbies", "personal", "interests"
-    ]
+    segments = list(re.finditer(r"[^.\n]+", text))
+    hits = SIGNAL_MATCHER.groups_by_segment(
+        text, [segment.start() for segment in segments]
+    )
 
     signals = []
 
-    for line in raw_lines:
-        l = line.lower()
-
-        if any(b in l for b in banned_sections):
+    for segment, groups in zip(segments, hits):
+        line = segment.group().strip()
+        if len(line) <= 25 or "banned" in groups:
             continue
 
-        if any(v in l for v in action_verbs):
-            signals.append(line.strip())
+        if "action" in groups:
+            signals.append(line)
             continue
 
-        if (
-            any(t in l for t in ["project", "application", "system", "model", "website"])
-            and len(line.split()) >= 8
-        ):
-            signals.append(line.strip())
+        if "topic" in groups and len(line.split()) >= 8:
+            signals.append(line)
 
     signals = list(dict.fromkeys(signals))
     if len(signals) < 5:
-        fallback = [
-            "Worked on real-world projects requiring problem-solving and decision-making",
-            "Handled responsibilities involving planning, execution, and improvement",
-            "Faced challenges while delivering outcomes under constraints",
-            "Collaborated with others to achieve project goals",
-            "Applied technical and analytical skills to practical tasks"
-        ]
-        signals.extend(fallback)
+        signals.extend(FALLBACK_SIGNALS)
 
     return signals[:10]
 
@@ -170,98 +181,8 @@ def domain_instruction(category: str) -> str:
 
 
 def get_question_templates(category: str):
+    return [variants[0] for variants in QUESTION_ENGINE.category_templates(category)]
 
-    core = [
-        "Tell me about a time you had to overcome a major challenge while {experience}.",
-        "What was the most difficult decision you made during {experience}?",
-        "Looking back, what would you do differently in {experience}?",
-        "What did you learn personally and professionally from {experience}?",
-        "How did you measure success in {experience}?",
-        "What risks were involved in {experience}, and how did you handle them?",
-        "How did you prioritize tasks during {experience}?",
-        "What surprised you the most while working on {experience}?",
-        "How did this experience shape your future approach to similar work?",
-        "What was the biggest mistake you made during {experience}, and what did it teach you?"
-    ]
-
-    technical = [
-        "How did you design the architecture for {experience}?",
-        "What technical trade-offs did you consider during {experience}?",
-        "How did you debug or troubleshoot issues in {experience}?",
-        "What performance optimizations did you implement in {experience}?",
-        "How did you ensure scalability or reliability in {experience}?",
-        "What technologies did you choose for {experience}, and why?",
-        "How did you handle failures or edge cases in {experience}?",
-        "What was the most complex technical problem in {experience}?",
-        "How did you test and validate your solution in {experience}?",
-        "If you rebuilt {experience} today, what would you change technically?",
-        "How did collaboration with other developers impact {experience}?",
-        "What security considerations were important in {experience}?",
-        "How did you manage database or API design in {experience}?",
-        "What bottlenecks did you encounter in {experience} and how did you fix them?",
-        "How did you ensure code quality during {experience}?"
-    ]
-
-    hr = [
-        "How did you handle conflict between team members during {experience}?",
-        "What communication strategy worked best in {experience}?",
-        "How did you motivate others while managing {experience}?",
-        "What challenges did you face with stakeholder expectations in {experience}?",
-        "How did you build trust within the team during {experience}?",
-        "What difficult conversation did you have during {experience}?",
-        "How did you ensure fairness and inclusion in {experience}?",
-        "What feedback did you receive during {experience}, and how did you respond?",
-        "How did you manage stress or pressure in {experience}?",
-        "What leadership qualities did you demonstrate in {experience}?"
-    ]
-
-    managerial = [
-        "How did you plan and execute {experience} from start to finish?",
-        "What strategic decisions were critical in {experience}?",
-        "How did you allocate resources during {experience}?",
-        "What risks threatened {experience}, and how did you mitigate them?",
-        "How did you track progress and performance in {experience}?",
-        "What trade-offs did you make between speed, cost, and quality in {experience}?",
-        "How did you align stakeholders during {experience}?",
-        "What would you improve in your leadership approach after {experience}?",
-        "How did you handle uncertainty or changing requirements in {experience}?",
-        "What impact did {experience} create for the organization?"
-    ]
-
-    collaboration = [
-        "How did you collaborate with others during {experience}?",
-        "How did you handle disagreements or differing opinions in {experience}?",
-        "How did you communicate progress or issues during {experience}?",
-        "What role did you personally play in {experience}?"
-    ]
-
-    leadership = [
-        "How did you plan and execute {experience}?",
-        "How did you prioritize tasks during {experience}?",
-        "What risks did you identify in {experience}, and how did you manage them?",
-        "How did you make decisions under pressure during {experience}?",
-        "How did you take ownership of outcomes in {experience}?"
-    ]
-
-    reflective = [
-        "What would you do differently if you faced {experience} again?",
-        "What was the biggest lesson from {experience}?",
-        "How did {experience} influence your professional growth?"
-    ]
-
-    if category == "IT":
-        return technical + core + reflective
-
-    if category == "HR":
-        return hr + collaboration + core
-
-    if category == "Managerial":
-        return managerial + leadership + core
-
-    return core + reflective
-
-
-    
 
 def simplify_signal(signal: str) -> str:
     signal = signal.strip()
@@ -273,35 +194,8 @@ def simplify_signal(signal: str) -> str:
 
     return signal.rstrip(".")
 
-INTERVIEWER_PERSONALITIES = {
-    "technical": {
-        "tone": "Be specific and focus on technical depth."
-    },
-    "mentor": {
-        "tone": "Explain clearly and include what you learned."
-    },
-    "hr": {
-        "tone": "Focus on communication, teamwork, and behavior."
-    },
-    "manager": {
-        "tone": "Justify decisions and business impact."
-    }
-}
-
-
-def apply_personality_tone(question: str, personality: str) -> str:
-    tone = INTERVIEWER_PERSONALITIES.get(personality, {}).get("tone", "")
-    if not tone:
-        return question
-
-    endings = [
-        f"{question} {tone}",
-        f"{question} Please elaborate.",
-        f"{question} Give a real example.",
-        f"{question} Explain your reasoning."
-    ]
-
-    return random.choice(endings)
+def apply_personality_tone(question: str, personality: str, rng=random) -> str:
+    return QUESTION_ENGINE.apply_tone(rng, question, personality)
 
 def generate_questions(
     text: str,
@@ -309,86 +203,104 @@ def generate_questions(
     difficulty: str,
     personality: str = "technical",
     asked_before=None,
-    num_questions: int = 8
+    num_questions: int = 8,
+    seed=None,
+    asked_lookup=None,
+    signals=None
 ):
-    asked_before = set(asked_before or [])
+    """
+    asked_before is an iterable of previously asked question texts;
+    asked_lookup, if given, is called once with the fingerprints of every
+    candidate question and returns the subset the user was already asked.
+    signals, if given, are experience signals already extracted from text.
+    Every random choice is drawn from random.Random(seed), so the same seed
+    and inputs always give the same questions. The draw order (signal
+    shuffle, all template picks, then the tones of the kept questions) is
+    not the one used before the template engine, so seeds do not reproduce
+    questions generated by older versions.
+    """
+    rng = random.Random(seed)
     questions = []
 
     text = normalize_resume(text)
-    signals = extract_experience_signals(text)
+    if signals is None:
+        signals = extract_experience_signals(text)
+    signals = list(signals)
 
     if not signals:
         signals = [text[:200]]
 
-    templates = get_question_templates(resume_category)
-
-    random.shuffle(signals)
+    rng.shuffle(signals)
 
+    candidates = []
     for signal in signals:
-        if len(questions) >= num_questions:
-            break
+        template = QUESTION_ENGINE.pick_template(rng, resume_category)
+        q = clean_question(template.format(experience=simplify_signal(signal)))
+        if q:
+            candidates.append((q, question_fingerprint(q)))
 
-        template = random.choice(templates)
+    generic = [(q, question_fingerprint(q)) for q in QUESTION_ENGINE.generic_questions]
 
-        if random.random() < 0.3:
-            template = template.replace("How did you", "Can you explain how you")
-        if random.random() < 0.2:
-            template = template.replace("What", "Could you describe what")
+    asked = QUESTION_ENGINE.fingerprints(asked_before or [])
+    if asked_lookup is not None:
+        asked |= set(asked_lookup([fp for _, fp in candidates + generic]))
 
-        q = clean_question(template.format(experience=simplify_signal(signal)))
+    for q, fingerprint in candidates:
+        if len(questions) >= num_questions:
+            break
 
-        if not q or q in asked_before:
+        if fingerprint in asked:
             continue
 
-        q = apply_personality_tone(q, personality)
+        q = apply_personality_tone(q, personality, rng)
 
         questions.append({
             "question": q,
             "difficulty": difficulty
         })
-        asked_before.add(q)
-
-    GENERIC = [
-        "Can you describe a challenging project and how you solved it?",
-        "What key decision shaped one of your projects?",
-        "How do you approach problems when requirements are unclear?",
-        "What mistake taught you the most?",
-        "How do you balance quality and deadlines?"
-    ]
+        asked.add(fingerprint)
 
     i = 0
     while len(questions) < num_questions:
-        q = apply_personality_tone(GENERIC[i % len(GENERIC)], personality)
+        base, fingerprint = generic[i % len(generic)]
 
-        if q not in asked_before:
+        # once every generic question has been asked before, allow repeats
+        if fingerprint not in asked or i >= 2 * len(generic):
             questions.append({
-                "question": q,
+                "question": apply_personality_tone(base, personality, rng),
                 "difficulty": difficulty
             })
-            asked_before.add(q)
+            asked.add(fingerprint)
 
         i += 1
 
     return questions
 
 def generate_ideal_answer(question: str):
-    cached = get_cached_ideal_answer(question)
-    if cached:
-        return cached
+    return generate_ideal_answers([question])[0]
+
 
-    model = load_scoring_model()
-    prompt = f"Provide a strong interview answer:\n{question}"
+def generate_ideal_answers(questions: list[str]) -> list[str]:
+    answers = [
+        ANSWER_BANK.get(q) or get_cached_ideal_answer(q, SCORING_MODEL)
+        for q in questions
+    ]
 
-    result = model(prompt, max_length=128)
-    answer = result[0]["generated_text"]
+    missing = list(dict.fromkeys(q for q, a in zip(questions, answers) if not a))
+    if missing:
+        generated = IDEAL_ANSWER_BATCHER.generate_many(
+            [IDEAL_ANSWER_PROMPT.format(question=q) for q in missing]
+        )
+        for q, answer in zip(missing, generated):
+            set_cached_ideal_answer(q, answer, SCORING_MODEL)
 
-    set_cached_ideal_answer(question, answer)
-    return answer
+        fresh = dict(zip(missing, generated))
+        answers = [a or fresh[q] for q, a in zip(questions, answers)]
 
+    return answers
 
-def generate_followup_question(question, answer, score, personality):
-    model = load_question_generator()
 
+def build_followup_prompt(question, answer, personality):
     if personality == "mentor":
         intent = "Ask a gentle clarification follow-up."
 
@@ -401,7 +313,7 @@ def generate_followup_question(question, answer, score, personality):
     else:  
         intent = "Challenge the decision and ask about ownership or impact."
 
-    prompt = f"""
+    return f"""
         You are a {personality} interviewer.
 
         Original Question:
@@ -416,8 +328,10 @@ def generate_followup_question(question, answer, score, personality):
         Ask ONE open-ended follow-up question.
         """
 
-    result = model(prompt, max_length=64)
-    return clean_question(result[0]["generated_text"])
+
+def generate_followup_question(question, answer, score, personality):
+    prompt = build_followup_prompt(question, answer, personality)
+    return clean_question(FOLLOWUP_BATCHER.generate(prompt))
 
 
 def interviewer_reaction_type(score: int):
@@ -485,41 +399,89 @@ def generate_interviewer_reaction(score: int):
 
 
 
+def score_live_answer(question: str, answer: str, personality: str):
+    ideal = generate_ideal_answer(question)
+    scored = score_answer(answer, ideal)
+
+    followup = None
+    if scored["score"] < 7:
+        followup = generate_followup_question(
+            question,
+            answer,
+            scored["score"],
+            personality
+        )
+
+    return scored, followup
+
+
+def score_session_answers(session_id: int, questions: list, answers: list, on_result=None):
+    pairs = list(zip(questions, answers))
+    question_texts = [q["question"] if isinstance(q, dict) else q for q, _ in pairs]
+    ideals = generate_ideal_answers(question_texts)
+    scores = score_answers([(a, ideal) for (_, a), ideal in zip(pairs, ideals)])
+
+    followup_futures = [
+        FOLLOWUP_BATCHER.submit(build_followup_prompt(question_text, a, "technical"))
+        for (_, a), question_text in zip(pairs, question_texts)
+    ]
+
+    interviewer_events = []
+    for index, ((q, a), scored, future) in enumerate(zip(pairs, scores, followup_futures)):
+        followup = clean_question(future.result())
+
+        interviewer_events.append({
+            "question": q,
+            "score": scored["score"],
+            "followup_question": followup
+        })
+        update_progress(session_id)
+
+        if on_result is not None:
+            on_result(index, scored, interviewer_events[-1])
+
+    return scores, interviewer_events
+
+
 class LiveFollowRequest(BaseModel):
     question: str
     answer: str
+    session_id: Optional[int] = None
     
+async def session_personality(session_id: Optional[int]) -> str:
+    query = select(InterviewSession.interviewer_personality)
+    if session_id:
+        query = query.where(InterviewSession.id == session_id)
+
+    async with async_session_scope() as db:
+        personality = await db.scalar(query.order_by(InterviewSession.id.desc()).limit(1))
+    return personality or "technical"
+
 @router.post("/live-followup")
-def live_followup(payload: LiveFollowRequest, db: Session = Depends(get_db)):
+async def live_followup(payload: LiveFollowRequest):
     try:
         question = payload.question
         answer = payload.answer
 
-        session = db.query(InterviewSession)\
-            .order_by(InterviewSession.id.desc())\
-            .first()
+        personality = await session_personality(payload.session_id)
 
-        personality = session.interviewer_personality if session else "technical"
+        scored, followup = await run_inference(score_live_answer, question, answer, personality)
 
-        ideal = generate_ideal_answer(question)
-        scored = score_answer(answer, ideal)
-
-        followup = None
         reaction = None
 
-        if scored["score"] < 7:
-            followup = generate_followup_question(
-                question,
-                answer,
-                scored["score"],
-                personality
-            )
-        else:
+        if followup is None:
             reaction = {
                 "type": "acknowledge",
                 "text": "Good answer, let's move to the next question."
             }
 
+        if payload.session_id:
+            await run_in_threadpool(
+                add_reaction,
+                payload.session_id,
+                reaction or generate_interviewer_reaction(scored["score"])
+            )
+
         return {
             "score": scored["score"],
             "breakdown": scored["breakdown"],
@@ -528,67 +490,211 @@ def live_followup(payload: LiveFollowRequest, db: Session = Depends(get_db)):
             "reaction": reaction
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         print("LIVE FOLLOWUP ERROR:", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+SESSIONS_PAGE_SIZE = 20
+
+def encode_sessions_cursor(created_at: datetime, session_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{session_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_sessions_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, session_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(session_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @router.get("/sessions/{user_id}")
-def get_interview_sessions(user_id: int, db: Session = Depends(get_db)):
-    sessions = (
-        db.query(InterviewSession)
-        .filter(InterviewSession.user_id == user_id)
-        .order_by(InterviewSession.created_at.desc())
-        .all()
+async def get_interview_sessions(
+    user_id: int,
+    limit: int = Query(SESSIONS_PAGE_SIZE, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Newest first, keyset-paginated on (created_at, id). Only the listed
+    columns are selected; the question count and score are computed in the
+    database so the question JSON never leaves it. Rows without a
+    created_at cannot be placed on the keyset and are not listed.
+    """
+    query = (
+        select(
+            InterviewSession.id,
+            InterviewSession.score,
+            func.json_array_length(InterviewSession.generated_questions).label("num_questions"),
+            InterviewSession.created_at,
+        )
+        .where(InterviewSession.user_id == user_id, InterviewSession.created_at.isnot(None))
+        .order_by(InterviewSession.created_at.desc(), InterviewSession.id.desc())
+        .limit(limit + 1)
+    )
+
+    if cursor:
+        created_at, session_id = decode_sessions_cursor(cursor)
+        query = query.where(or_(
+            InterviewSession.created_at < created_at,
+            and_(InterviewSession.created_at == created_at, InterviewSession.id < session_id)
+        ))
+
+    rows = (await db.execute(query)).all()
+    page = rows[:limit]
+    next_cursor = (
+        encode_sessions_cursor(page[-1].created_at, page[-1].id)
+        if len(rows) > limit else None
     )
 
     return {
         "sessions": [
             {
-                "id": s.id,
-                "score": s.feedback.get("score") if isinstance(s.feedback, dict) else None,
-                "num_questions": len(s.generated_questions or []),
-                "created_at": s.created_at,
+                "id": row.id,
+                "score": row.score,
+                "num_questions": row.num_questions or 0,
+                "created_at": row.created_at,
             }
-            for s in sessions
-        ]
+            for row in page
+        ],
+        "next_cursor": next_cursor
     }
 
 
+def dialect_insert(db: AsyncSession):
+    return postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+
+
+async def get_or_create_resume(db: AsyncSession, text: str) -> int:
+    """
+    Resumes are stored once per distinct text, keyed by its SHA-256.
+    """
+    content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    await db.execute(
+        dialect_insert(db)(Resume)
+        .values(content_hash=content_hash, text=text)
+        .on_conflict_do_nothing(index_elements=["content_hash"])
+    )
+    return await db.scalar(select(Resume.id).where(Resume.content_hash == content_hash))
+
+
+async def lookup_asked_questions(db: AsyncSession, user_id: int, fingerprints) -> set:
+    rows = await db.scalars(
+        select(AskedQuestion.question_hash)
+        .where(
+            AskedQuestion.user_id == user_id,
+            AskedQuestion.question_hash.in_(list(set(fingerprints)))
+        )
+    )
+    return set(rows)
+
+
+async def record_asked_questions(db: AsyncSession, user_id: int, session_id: int, questions):
+    fingerprints = QUESTION_ENGINE.fingerprints(questions)
+    if not fingerprints:
+        return
+
+    await db.execute(
+        dialect_insert(db)(AskedQuestion)
+        .values([
+            {"user_id": user_id, "question_hash": fp, "session_id": session_id}
+            for fp in fingerprints
+        ])
+        .on_conflict_do_nothing(index_elements=["user_id", "question_hash"])
+    )
+
+
+def classify_resume_category(text: str, embedding=None):
+    """
+    Returns (category, method, embedding) using the configured classifier.
+    """
+    if RESUME_CLASSIFIER == "embedding":
+        return classify_resume(text, RESUME_CLASSIFIER_MIN_CONFIDENCE, embedding)
+    return detect_resume_category(text), "keywords", embedding
+
+
+def analyze_resume(text: str):
+    normalized = normalize_resume(text)
+    category, method, embedding = classify_resume_category(text)
+    artifact = {
+        "text": text,
+        "normalized_text": normalized,
+        "signals": extract_experience_signals(normalized),
+        "category": category,
+        "category_method": method,
+        "classifier": RESUME_CLASSIFIER
+    }
+    return artifact, embedding
+
+
+def reclassify_resume(sha256: str, artifact: dict) -> dict:
+    embedding = RESUME_CACHE.get_embedding(sha256)
+    category, method, fresh = classify_resume_category(artifact["text"], embedding)
+    artifact = {**artifact, "category": category, "category_method": method, "classifier": RESUME_CLASSIFIER}
+    RESUME_CACHE.put(sha256, artifact, embedding=fresh if embedding is None else None)
+    return artifact
+
+
+async def load_resume_artifact(file):
+    """
+    Returns (artifact, extraction summary) for an uploaded PDF.
+    Uploads are hashed while spooled; a resume whose bytes were seen before
+    is served from RESUME_CACHE without opening the PDF again.
+    """
+    path, size, sha256 = await spool_upload(file)
+    try:
+        artifact = await run_in_threadpool(RESUME_CACHE.get, sha256)
+        if artifact is not None:
+            if artifact.get("classifier") != RESUME_CLASSIFIER:
+                artifact = await run_in_threadpool(reclassify_resume, sha256, artifact)
+            return artifact, {"bytes": size, "cached": True}
+
+        extracted = await extract_spooled(path, sha256, size)
+    finally:
+        os.unlink(path)
+
+    if not extracted.text.strip():
+        raise ResumeRejected(400, "Empty resume")
+
+    artifact, embedding = await run_in_threadpool(analyze_resume, extracted.text)
+    await run_in_threadpool(RESUME_CACHE.put, sha256, artifact, embedding)
+    return artifact, {**extracted.timing_summary(), "cached": False}
+
+
 @router.post("/upload-resume")
 async def upload_resume(
     user_id: int = Form(...),
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     if file.content_type != "application/pdf":
         raise HTTPException(status_code=400, detail="Only PDF files allowed")
 
-    contents = await file.read()
-    reader = PyPDF2.PdfReader(io.BytesIO(contents))
-    text = "".join(page.extract_text() or "" for page in reader.pages)
-
-    if not text.strip():
-        raise HTTPException(status_code=400, detail="Empty resume")
-
-    resume_category = detect_resume_category(text)
+    try:
+        artifact, extraction = await load_resume_artifact(file)
+    except ResumeRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
 
-    previous = (
-        db.query(InterviewSession.asked_questions)
-        .filter(InterviewSession.user_id == user_id)
-        .all()
-    )
-    asked_before = [q for row in previous for q in (row[0] or [])]
+    text = artifact["text"]
+    resume_category = artifact["category"]
 
-    personality = random.choice(list(INTERVIEWER_PERSONALITIES.keys()))
+    personality = random.choice(list(PERSONALITY_TONES.keys()))
 
     try:
-        questions = generate_questions(
+        questions = await run_in_threadpool(
+            generate_questions,
             text=text,
             resume_category=resume_category,
             difficulty="Easy",
             personality=personality,      
-            asked_before=asked_before,
-            num_questions=8
+            # called on the worker thread; the query runs back on the event loop
+            asked_lookup=lambda fingerprints: from_thread.run(
+                lookup_asked_questions, db, user_id, fingerprints
+            ),
+            num_questions=8,
+            signals=artifact["signals"]
         )
     except Exception as e:
         print("UPLOAD RESUME ERROR:", e)
@@ -596,29 +702,139 @@ async def upload_resume(
 
     interview = InterviewSession(
         user_id=user_id,
-        resume_text=text,
+        resume_id=await get_or_create_resume(db, text),
         generated_questions=questions,
-        asked_questions=[q["question"] for q in questions],
         resume_category=resume_category,
         interviewer_personality=personality,   
-        user_answers=[],
-        feedback={}
     )
 
     db.add(interview)
-    db.commit()
-    db.refresh(interview)
+    await db.flush()
+    await record_asked_questions(db, user_id, interview.id, [q["question"] for q in questions])
+    await db.commit()
 
     return {
         "session_id": interview.id,
         "resume_category": resume_category,
         "interviewer_personality": personality,
-        "generated_questions": questions
+        "generated_questions": questions,
+        "extraction": extraction
     }
 
 
+async def session_exists(session_id: int) -> bool:
+    async with async_session_scope() as db:
+        found = await db.scalar(select(InterviewSession.id).where(InterviewSession.id == session_id))
+    return found is not None
+
+
+async def save_session_feedback(session_id: int, questions: list, answers: list, feedback: dict):
+    """
+    Stores the overall score on the session and one typed row per answer,
+    replacing the rows of any earlier attempt.
+    """
+    details = feedback.get("details") or []
+    followups = feedback.get("followup_questions") or []
+
+    rows = []
+    for position, (question, answer) in enumerate(zip(questions, answers)):
+        scored = details[position] if position < len(details) else {}
+        breakdown = scored.get("breakdown") or {}
+        followup = followups[position] if position < len(followups) else {}
+        rows.append(SessionAnswer(
+            session_id=session_id,
+            position=position,
+            question=question["question"] if isinstance(question, dict) else str(question),
+            answer=answer or "",
+            score=scored.get("score"),
+            technical=breakdown.get("technical"),
+            clarity=breakdown.get("clarity"),
+            communication=breakdown.get("communication"),
+            why_lost=scored.get("why_lost"),
+            followup_question=followup.get("followup_question")
+        ))
+
+    async with async_session_scope() as db:
+        updated = await db.execute(
+            update(InterviewSession)
+            .where(InterviewSession.id == session_id)
+            .values(score=feedback["score"])
+        )
+        if not updated.rowcount:
+            return
+
+        await db.execute(delete(SessionAnswer).where(SessionAnswer.session_id == session_id))
+        db.add_all(rows)
+        await db.commit()
+
+
+async def run_scoring_job(job, questions: list, answers: list):
+    session_id = job.session_id
+    loop = asyncio.get_running_loop()
+    max_per_question = 10
+    job.mark_running()
+
+    def result_event(index, scored, interviewer_event):
+        return {
+            **scored,
+            **interviewer_event,
+            "index": index,
+            "current": index + 1,
+            "total": job.total
+        }
+
+    def on_result(index, scored, interviewer_event):
+        loop.call_soon_threadsafe(job.publish, "result", result_event(index, scored, interviewer_event))
+
+    try:
+        streaming = INFERENCE.kind == "thread"
+        results, interviewer_events = await INFERENCE.run(
+            score_session_answers,
+            session_id,
+            questions,
+            answers,
+            on_result=on_result if streaming else None,
+            timeout=SCORE_SESSION_TIMEOUT_SECONDS
+        )
+
+        if not streaming:
+            for index, (scored, event) in enumerate(zip(results, interviewer_events)):
+                job.publish("result", result_event(index, scored, event))
+
+        total_score = sum(r["score"] for r in results)
+
+        final_score = int(
+            (total_score / (len(results) * max_per_question)) * 100
+        )   if results else 0
+
+        feedback = {
+            "score": final_score,
+            "details": results,
+            "followup_questions": interviewer_events
+        }
+        await save_session_feedback(session_id, questions, answers, feedback)
+
+        job.publish("complete", {
+            "overall_score": final_score,
+            "details": results,
+            "followup_questions": interviewer_events
+        })
+
+    except InferenceOverloaded:
+        job.publish("job_error", {"detail": "Inference queue is full, try again shortly"})
+    except InferenceTimeout:
+        job.publish("job_error", {"detail": "Inference timed out"})
+    except Exception as e:
+        print("SCORE SESSION ERROR:", e)
+        job.publish("job_error", {"detail": str(e)})
+    finally:
+        await run_in_threadpool(clear_progress, session_id)
+        await run_in_threadpool(clear_reactions, session_id)
+        expire_job_later(job)
+
+
 @router.post("/score-session")
-def score_session(payload: dict, db: Session = Depends(get_db)):
+async def score_session(payload: dict):
     session_id = payload.get("session_id")
     questions = payload.get("questions", [])
     answers = payload.get("answers", [])
@@ -626,82 +842,114 @@ def score_session(payload: dict, db: Session = Depends(get_db)):
     if not session_id:
         raise HTTPException(status_code=400, detail="Missing session_id")
 
-    interview = db.query(InterviewSession).filter_by(id=session_id).first()
-    if not interview:
+    # the connection is released before the scoring job starts; results are
+    # written from a fresh session once inference is done
+    if not await session_exists(session_id):
         raise HTTPException(status_code=404, detail="Session not found")
 
-    init_progress(session_id, len(questions))
-    init_interviewer(session_id)
+    if INFERENCE.pending >= INFERENCE.max_pending:
+        raise HTTPException(status_code=503, detail="Inference queue is full, try again shortly")
 
-    results = []
-    interviewer_events = []
-    followup_questions = []
-    total_score = 0
-    max_per_question = 10
-    
-    init_interviewer(session_id)
+    await run_in_threadpool(init_progress, session_id, len(questions))
+    await run_in_threadpool(init_interviewer, session_id)
 
-    for q, a in zip(questions, answers):
-        question_text = q["question"] if isinstance(q, dict) else q
-        ideal = generate_ideal_answer(question_text)
-        scored = score_answer(a, ideal)
+    job = create_job(session_id, min(len(questions), len(answers)))
+    await asyncio.wrap_future(job.saved)
+    job.task = asyncio.create_task(run_scoring_job(job, questions, answers))
 
-        followup = generate_followup_question(question_text, a, scored["score"], personality="technical")
+    return {
+        "job_id": job.id,
+        "session_id": session_id,
+        "status": job.status,
+        "events_url": f"/interview/score-jobs/{job.id}/events"
+    }
 
-        interviewer_events.append({
-            "question": q,
-            "score": scored["score"],
-            "followup_question": followup
-        })
-        
-        results.append(scored)
-        
-        total_score += scored["score"]
-        update_progress(session_id)
 
-    final_score = int(
-        (total_score / (len(results) * max_per_question)) * 100
-    )   if results else 0
+@router.get("/score-jobs/{job_id}")
+def score_job_status(job_id: str):
+    job = get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Scoring job not found")
+    return job.summary()
 
-    interview.user_answers = [
-        {"question": q, "answer": a}
-        for q, a in zip(questions, answers)
-    ]
-    interview.feedback = {
-        "score": final_score,
-        "details": results,
-        "followup_questions": interviewer_events
-    }
-    interview.score = final_score
 
-    db.commit()
-    clear_progress(session_id)
-    clear_reactions(session_id)
+@router.get("/score-jobs/{job_id}/events")
+async def score_job_events(job_id: str):
+    job = await run_in_threadpool(get_job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Scoring job not found")
+
+    async def event_stream():
+        async for event, data in job.stream():
+            yield format_sse(event, data)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
-    return {
-        "overall_score": final_score,
-        "details": results,
-        "followup_questions": interviewer_events
-    }
-    
 @router.get("/session/{session_id}")
-def get_session(session_id: int, db: Session = Depends(get_db)):
-    session = db.query(InterviewSession).filter(
-        InterviewSession.id == session_id
-    ).first()
+async def get_session(session_id: int, db: AsyncSession = Depends(get_async_db)):
+    session = (await db.execute(
+        select(
+            InterviewSession.id,
+            InterviewSession.generated_questions,
+            InterviewSession.resume_category,
+            InterviewSession.score,
+            InterviewSession.created_at,
+        )
+        .where(InterviewSession.id == session_id)
+    )).first()
 
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
+    answers = (await db.scalars(
+        select(SessionAnswer)
+        .where(SessionAnswer.session_id == session_id)
+        .order_by(SessionAnswer.position)
+    )).all()
+
     return {
         "id": session.id,
         "generated_questions": session.generated_questions,
-        "user_answers": session.user_answers,
-        "feedback": session.feedback,
+        "user_answers": [
+            {"question": a.question, "answer": a.answer, "score": a.score}
+            for a in answers
+        ],
+        "feedback": {
+            "score": session.score,
+            "details": [
+                {
+                    "score": a.score,
+                    "breakdown": {
+                        "technical": a.technical,
+                        "clarity": a.clarity,
+                        "communication": a.communication
+                    },
+                    "why_lost": a.why_lost or []
+                }
+                for a in answers
+            ],
+            "followup_questions": [
+                {"question": a.question, "score": a.score, "followup_question": a.followup_question}
+                for a in answers
+            ]
+        } if session.score is not None else {},
+        "score": session.score,
         "resume_category": session.resume_category,
         "created_at": session.created_at
     }
 
 @router.get("/score-progress/{session_id}")
 def score_progress(session_id: int):
-    return get_progress(session_id)
\ No newline at end of file
+    return get_progress(session_id)
+
+@router.get("/cache-stats")
+def cache_stats():
+    return {
+        "ideal_answers": ideal_cache_stats(),
+        "answer_bank": ANSWER_BANK.summary(),
+        "resumes": RESUME_CACHE.summary()
+    }
\ No newline at end of file
@@ -1,9 +1,9 @@
-from transformers import pipeline
-import random
+from app.model_registry import get_model, QUESTION_GENERATION_MODEL
 
 class AIService:
-    def __init__(self):
-        self.question_generator = pipeline("text2text-generation", model="mrm8488/t5-base-finetuned-question-generation-ap")
+    @property
+    def question_generator(self):
+        return get_model(QUESTION_GENERATION_MODEL)
     
     def generate_questions(self, resume_text, num_questions=5):
         prompts = self._create_prompts(resume_text)
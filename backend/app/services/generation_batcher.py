@@ -0,0 +1,79 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from app.config import GENERATION_MAX_BATCH_SIZE, GENERATION_MAX_WAIT_MS
+
+
+class GenerationBatcher:
+    """
+    Micro-batches text2text generation across concurrent callers.
+    Prompts submitted within max_wait_ms of the first queued prompt (up to
+    max_batch_size of them) go through one padded pipeline call on a single
+    background thread, and each caller gets back its own generated text.
+    """
+
+    def __init__(self, loader, max_batch_size: int = GENERATION_MAX_BATCH_SIZE,
+                 max_wait_ms: float = GENERATION_MAX_WAIT_MS, **generate_kwargs):
+        self.loader = loader
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self.generate_kwargs = generate_kwargs
+        self.stats = {"batches": 0, "prompts": 0}
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, prompt: str) -> Future:
+        self._ensure_started()
+        future = Future()
+        self._queue.put((prompt, future))
+        return future
+
+    def generate(self, prompt: str) -> str:
+        return self.submit(prompt).result()
+
+    def generate_many(self, prompts) -> list[str]:
+        futures = [self.submit(prompt) for prompt in prompts]
+        return [future.result() for future in futures]
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="generation-batcher", daemon=True)
+                self._thread.start()
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            prompts = [prompt for prompt, _ in batch]
+
+            try:
+                model = self.loader()
+                outputs = model(prompts, batch_size=len(prompts), **self.generate_kwargs)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.stats["batches"] += 1
+            self.stats["prompts"] += len(prompts)
+
+            for (_, future), output in zip(batch, outputs):
+                if isinstance(output, list):
+                    output = output[0]
+                future.set_result(output["generated_text"])
@@ -0,0 +1,88 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+from app.config import INFERENCE_EXECUTOR, INFERENCE_WORKERS, INFERENCE_MAX_PENDING, INFERENCE_TIMEOUT_SECONDS
+
+
+class InferenceOverloaded(Exception):
+    pass
+
+
+class InferenceTimeout(Exception):
+    pass
+
+
+class InferenceExecutor:
+    """
+    Bounded executor for model calls.
+    At most `workers` calls run at once; once `max_pending` calls are queued
+    or running, new calls are rejected with InferenceOverloaded instead of
+    piling up. kind="process" runs calls in spawned worker processes, each
+    holding its own copy of the models.
+    """
+
+    def __init__(self, kind: str, workers: int, max_pending: int, timeout: float, name: str = "inference"):
+        self.kind = kind
+        self.name = name
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix=self.name
+                )
+        return self._executor
+
+    def _release(self, _future):
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, fn, *args, timeout: float = None, **kwargs):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise InferenceOverloaded(f"{self._pending} {self.name} calls already pending")
+            self._pending += 1
+
+        try:
+            future = self._get_executor().submit(partial(fn, *args, **kwargs))
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise InferenceTimeout(f"{self.name} call did not finish within {timeout or self.timeout}s")
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+INFERENCE = InferenceExecutor(
+    INFERENCE_EXECUTOR,
+    INFERENCE_WORKERS,
+    INFERENCE_MAX_PENDING,
+    INFERENCE_TIMEOUT_SECONDS
+)
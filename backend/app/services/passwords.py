@@ -0,0 +1,37 @@
+from passlib.context import CryptContext
+from app.config import (
+    PASSWORD_HASH_ROUNDS, PASSWORD_HASH_MIN_ROUNDS, PASSWORD_HASH_WORKERS,
+    PASSWORD_HASH_MAX_PENDING, PASSWORD_HASH_TIMEOUT_SECONDS
+)
+from app.services.inference import InferenceExecutor
+
+# hashes below min_rounds are reported as needing an update on login
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    deprecated="auto",
+    pbkdf2_sha256__default_rounds=PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__min_rounds=PASSWORD_HASH_MIN_ROUNDS
+)
+
+# pbkdf2 releases the GIL inside hashlib, so a small thread pool hashes in
+# parallel without stalling the event loop; bursts beyond max_pending are
+# rejected rather than queued behind each other
+PASSWORD_EXECUTOR = InferenceExecutor(
+    "thread",
+    PASSWORD_HASH_WORKERS,
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_TIMEOUT_SECONDS,
+    name="password-hash"
+)
+
+
+async def hash_password(password: str) -> str:
+    return await PASSWORD_EXECUTOR.run(pwd_context.hash, password)
+
+
+async def verify_password(password: str, hashed_password: str):
+    """
+    Returns (valid, new_hash). new_hash is set when the stored hash uses
+    outdated parameters and should replace it.
+    """
+    return await PASSWORD_EXECUTOR.run(pwd_context.verify_and_update, password, hashed_password)
@@ -0,0 +1,154 @@
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import PyPDF2
+from starlette.concurrency import run_in_threadpool
+from app.config import (
+    MAX_RESUME_BYTES, MAX_RESUME_PAGES, RESUME_EXTRACT_WORKERS,
+    RESUME_PARALLEL_MIN_PAGES, RESUME_SPOOL_DIR
+)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class ResumeRejected(Exception):
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class ExtractedResume:
+    def __init__(self, text: str, sha256: str, size: int, page_timings: list):
+        self.text = text
+        self.sha256 = sha256
+        self.size = size
+        self.page_timings = page_timings
+
+    def timing_summary(self) -> dict:
+        return {
+            "bytes": self.size,
+            "pages": len(self.page_timings),
+            "page_ms": [round(seconds * 1000, 2) for seconds in self.page_timings],
+        }
+
+
+_pool = None
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=RESUME_EXTRACT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def spool_upload(file, max_bytes: int = MAX_RESUME_BYTES):
+    """
+    Copies an upload to a temp file in fixed-size chunks, hashing as it
+    goes and rejecting it as soon as it exceeds max_bytes.
+    Returns (path, size, sha256); the caller owns the file.
+    """
+    if getattr(file, "size", None) and file.size > max_bytes:
+        raise ResumeRejected(413, f"Resume exceeds the {max_bytes} byte upload limit")
+
+    digest = hashlib.sha256()
+    size = 0
+    fd, path = tempfile.mkstemp(suffix=".pdf", dir=RESUME_SPOOL_DIR)
+
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await file.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ResumeRejected(413, f"Resume exceeds the {max_bytes} byte upload limit")
+                digest.update(chunk)
+                await run_in_threadpool(out.write, chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+
+    return path, size, digest.hexdigest()
+
+
+def count_pages(path: str) -> int:
+    return len(PyPDF2.PdfReader(path).pages)
+
+
+def extract_page_range(path: str, start: int, stop: int) -> list:
+    reader = PyPDF2.PdfReader(path)
+    pages = []
+    for index in range(start, stop):
+        started = time.perf_counter()
+        text = reader.pages[index].extract_text() or ""
+        pages.append((text, time.perf_counter() - started))
+    return pages
+
+
+def _page_ranges(page_count: int, parts: int) -> list:
+    parts = max(1, min(parts, page_count))
+    step, extra = divmod(page_count, parts)
+    ranges, start = [], 0
+    for i in range(parts):
+        stop = start + step + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+async def extract_pages(path: str, max_pages: int = MAX_RESUME_PAGES) -> list:
+    """
+    Returns [(text, seconds), ...] in page order. Page counts above
+    max_pages are rejected before any text is extracted; larger documents
+    are split into contiguous page ranges across the extraction pool.
+    Any parser failure on the upload is reported as an invalid PDF (400);
+    a broken extraction pool is not the upload's fault and propagates.
+    """
+    try:
+        page_count = await run_in_threadpool(count_pages, path)
+    except Exception:
+        raise ResumeRejected(400, "Invalid PDF file")
+
+    if page_count > max_pages:
+        raise ResumeRejected(413, f"Resume has {page_count} pages, the limit is {max_pages}")
+
+    try:
+        if page_count < RESUME_PARALLEL_MIN_PAGES or RESUME_EXTRACT_WORKERS <= 1:
+            return await run_in_threadpool(extract_page_range, path, 0, page_count)
+
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(_get_pool(), extract_page_range, path, start, stop)
+            for start, stop in _page_ranges(page_count, RESUME_EXTRACT_WORKERS)
+        ))
+    except BrokenProcessPool:
+        raise
+    except Exception:
+        raise ResumeRejected(400, "Invalid PDF file")
+    return [page for chunk in chunks for page in chunk]
+
+
+async def extract_spooled(path: str, sha256: str, size: int) -> ExtractedResume:
+    pages = await extract_pages(path)
+    return ExtractedResume(
+        text="".join(text for text, _ in pages),
+        sha256=sha256,
+        size=size,
+        page_timings=[seconds for _, seconds in pages]
+    )
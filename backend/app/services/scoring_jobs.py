@@ -0,0 +1,179 @@
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from starlette.concurrency import run_in_threadpool
+from app.config import SCORING_JOB_TTL_SECONDS
+from app.utils.state_store import STATE
+
+TERMINAL_EVENTS = ("complete", "job_error")
+NAMESPACE = "scoring_jobs"
+EVENTS_NAMESPACE = "scoring_job_events"
+REMOTE_POLL_SECONDS = 0.5
+
+# write-behind for the shared state store: a single thread keeps the writes
+# in publish order and keeps SQLite I/O (and its lock waits) off the loop
+_STORE_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scoring-job-store")
+
+def _write_behind(fn, *args, **kwargs):
+    future = _STORE_WRITER.submit(fn, *args, **kwargs)
+    future.add_done_callback(_report_write_error)
+    return future
+
+def _report_write_error(future):
+    if future.exception() is not None:
+        print("SCORING JOB STORE ERROR:", future.exception())
+
+
+def _event_key(job_id: str, seq: int) -> str:
+    return f"{job_id}:{seq}"
+
+
+def _load_events(job_id: str, start: int = 0) -> list:
+    events = []
+    while True:
+        item = STATE.get(EVENTS_NAMESPACE, _event_key(job_id, start + len(events)))
+        if item is None:
+            return events
+        events.append(tuple(item))
+
+
+def _summarize(job_id: str, session_id: int, status: str, total: int, events: list) -> dict:
+    result = next((data for event, data in events if event == "complete"), None)
+    error = next((data.get("detail") for event, data in events if event == "job_error"), None)
+    return {
+        "job_id": job_id,
+        "session_id": session_id,
+        "status": status,
+        "scored": sum(1 for event, _ in events if event == "result"),
+        "total": total,
+        "result": result,
+        "error": error,
+    }
+
+
+class ScoringJob:
+    def __init__(self, session_id: int, total: int):
+        self.id = uuid.uuid4().hex
+        self.session_id = session_id
+        self.total = total
+        self.status = "queued"
+        self.created_at = time.time()
+        self.events = []
+        self._subscribers = set()
+        # awaited before the job id is handed out, so any worker can find it
+        self.saved = self._save()
+
+    def _save(self):
+        return _write_behind(STATE.set, NAMESPACE, self.id, {
+            "session_id": self.session_id,
+            "total": self.total,
+            "status": self.status,
+        }, ttl=SCORING_JOB_TTL_SECONDS)
+
+    def mark_running(self):
+        self.status = "running"
+        self._save()
+
+    def publish(self, event: str, data: dict):
+        """
+        Records an event and hands it to every live subscriber.
+        Must be called on the event loop thread; only the in-memory fan-out
+        happens there. Each event is mirrored to the shared state store as
+        its own entry (plus the job record when the status changes) by the
+        write-behind thread, so other workers can serve the log.
+        """
+        _write_behind(
+            STATE.set, EVENTS_NAMESPACE, _event_key(self.id, len(self.events)), [event, data],
+            ttl=SCORING_JOB_TTL_SECONDS
+        )
+        self.events.append((event, data))
+        if event == "complete":
+            self.status = "completed"
+            self._save()
+        elif event == "job_error":
+            self.status = "failed"
+            self._save()
+
+        for queue in self._subscribers:
+            queue.put_nowait((event, data))
+
+    async def stream(self):
+        """
+        Yields (event, data) pairs: everything published so far, then live
+        events until the job completes or fails.
+        """
+        queue = asyncio.Queue()
+        for item in self.events:
+            queue.put_nowait(item)
+
+        self._subscribers.add(queue)
+        try:
+            while True:
+                event, data = await queue.get()
+                yield event, data
+                if event in TERMINAL_EVENTS:
+                    return
+        finally:
+            self._subscribers.discard(queue)
+
+    def summary(self) -> dict:
+        return _summarize(self.id, self.session_id, self.status, self.total, self.events)
+
+
+class RemoteScoringJob:
+    """
+    Read-only view of a job running on another worker, rebuilt from the
+    shared state store. stream() polls the store for new events.
+    """
+
+    def __init__(self, job_id: str, record: dict, events: list):
+        self.id = job_id
+        self.session_id = record["session_id"]
+        self.total = record["total"]
+        self.status = record["status"]
+        self.events = events
+
+    async def stream(self):
+        sent = 0
+        while True:
+            for event, data in self.events[sent:]:
+                yield event, data
+                if event in TERMINAL_EVENTS:
+                    return
+            sent = len(self.events)
+
+            await asyncio.sleep(REMOTE_POLL_SECONDS)
+            if await run_in_threadpool(STATE.get, NAMESPACE, self.id) is None:
+                yield "job_error", {"detail": "Scoring job expired"}
+                return
+            self.events.extend(await run_in_threadpool(_load_events, self.id, sent))
+
+    def summary(self) -> dict:
+        return _summarize(self.id, self.session_id, self.status, self.total, self.events)
+
+
+SCORING_JOBS = {}
+
+def create_job(session_id: int, total: int) -> ScoringJob:
+    job = ScoringJob(session_id, total)
+    SCORING_JOBS[job.id] = job
+    return job
+
+def get_job(job_id: str):
+    """
+    Jobs started by this worker come from memory; others are rebuilt from
+    the shared state store, which blocks, so async callers should run this
+    in a thread.
+    """
+    job = SCORING_JOBS.get(job_id)
+    if job is not None:
+        return job
+
+    record = STATE.get(NAMESPACE, job_id)
+    return RemoteScoringJob(job_id, record, _load_events(job_id)) if record is not None else None
+
+def expire_job_later(job: ScoringJob):
+    asyncio.get_running_loop().call_later(
+        SCORING_JOB_TTL_SECONDS, SCORING_JOBS.pop, job.id, None
+    )
@@ -0,0 +1,83 @@
+"""
+Precomputes ideal answers for every question the templates can produce
+without resume-specific signals, and writes them to ANSWER_BANK_PATH.
+
+    python -m app.training.build_answer_bank
+
+The question set is every category template in all four phrasings, filled
+with each fallback signal, plus the generic questions; each with no closing
+sentence and with every personality's closing sentence. Answers are
+generated in large batches with the scoring model and embedded with the
+scoring encoder so request-time scoring can reuse both.
+"""
+import argparse
+import time
+from app.config import ANSWER_BANK_PATH
+from app.ml_scoring import clean_text, encode_texts
+from app.model_registry import get_model, SCORING_MODEL, SENTENCE_MODEL
+from app.routes.interview import (
+    FALLBACK_SIGNALS, IDEAL_ANSWER_PROMPT, clean_question, simplify_signal
+)
+from app.services.generation_batcher import GenerationBatcher
+from app.utils.answer_bank import write_answer_bank
+from app.utils.question_templates import QUESTION_ENGINE, question_fingerprint
+
+
+def enumerate_questions() -> list:
+    bases = []
+    for category in QUESTION_ENGINE.templates:
+        for variants in QUESTION_ENGINE.category_templates(category):
+            for template in variants:
+                for signal in FALLBACK_SIGNALS:
+                    q = clean_question(template.format(experience=simplify_signal(signal)))
+                    if q:
+                        bases.append(q)
+    bases.extend(QUESTION_ENGINE.generic_questions)
+
+    endings = sorted({e for endings in QUESTION_ENGINE.endings.values() for e in endings})
+    questions = {}
+    for base in bases:
+        for q in [base] + [f"{base} {ending}" for ending in endings]:
+            questions.setdefault(question_fingerprint(q), q)
+    return list(questions.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the precomputed ideal answer bank.")
+    parser.add_argument("--output", default=ANSWER_BANK_PATH)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--chunk", type=int, default=1024, help="questions per progress step")
+    args = parser.parse_args(argv)
+
+    questions = enumerate_questions()
+    print(f"Generating ideal answers for {len(questions)} questions")
+
+    batcher = GenerationBatcher(
+        lambda: get_model(SCORING_MODEL), max_batch_size=args.batch_size, max_length=128
+    )
+    answers = []
+    started = time.perf_counter()
+    for start in range(0, len(questions), args.chunk):
+        chunk = questions[start:start + args.chunk]
+        answers.extend(batcher.generate_many([IDEAL_ANSWER_PROMPT.format(question=q) for q in chunk]))
+        print(f"{len(answers)}/{len(questions)} answers ({time.perf_counter() - started:.0f}s)")
+
+    embedding_texts = list(dict.fromkeys(clean_text(a) for a in answers))
+    embeddings = []
+    for start in range(0, len(embedding_texts), args.chunk):
+        embeddings.extend(encode_texts(embedding_texts[start:start + args.chunk]))
+
+    metadata = {
+        "version": time.strftime("v%Y%m%d%H%M%S"),
+        "model": SCORING_MODEL,
+        "encoder": SENTENCE_MODEL,
+        "prompt": IDEAL_ANSWER_PROMPT,
+        "questions": len(questions),
+        "created_at": time.time(),
+    }
+    write_answer_bank(args.output, questions, answers, embedding_texts, embeddings, metadata)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Trains the answer regression scorer used by SCORER_BACKEND=regression.
+
+    python -m app.training.train_scorer --data ../ai_model/training_data.jsonl --promote
+
+Rows are streamed from the jsonl file and encoded in batches with the same
+encoder pass as ml_scoring. Features are cached in a memory-mapped .npy
+keyed by the dataset hash, and the regressor is fitted from accumulated
+normal equations, so the dataset never has to fit in RAM.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+import numpy as np
+from app.config import CACHE_DIR, SCORING_WEIGHTS_PATH
+from app.model_registry import SENTENCE_MODEL
+
+FEATURE = "token_mean"
+PREPROCESSING = "clean_text"
+FIT_CHUNK_ROWS = 65536
+
+
+def dataset_fingerprint(path: str) -> tuple:
+    """
+    Returns (sha256 of the file, number of usable rows).
+    """
+    digest = hashlib.sha256()
+    rows = 0
+    with open(path, "rb") as f:
+        for line in f:
+            digest.update(line)
+            if line.strip():
+                rows += 1
+    return digest.hexdigest(), rows
+
+
+def stream_examples(path: str):
+    """
+    Yields (answer, score) with the answer cleaned exactly as score_answers
+    cleans it, so training and serving encode the same text.
+    """
+    from app.ml_scoring import REGRESSION_PREPROCESSING
+    prepare = REGRESSION_PREPROCESSING[PREPROCESSING]
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line)
+            yield prepare(item["answer"]), float(item["score"])
+
+
+def encode_dataset(path: str, rows: int, cache_path: str, batch_size: int):
+    """
+    Fills <cache_path>.features.npy / .targets.npy batch by batch and
+    returns them memory-mapped. An existing complete cache is reused.
+    """
+    from app.ml_scoring import encode_with_token_means
+
+    features_path = cache_path + ".features.npy"
+    targets_path = cache_path + ".targets.npy"
+    if os.path.exists(features_path) and os.path.exists(targets_path):
+        features = np.load(features_path, mmap_mode="r")
+        targets = np.load(targets_path, mmap_mode="r")
+        if len(features) == len(targets) == rows:
+            print(f"Using cached features {features_path}")
+            return features, targets
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    features = targets = None
+    row = 0
+    batch_answers, batch_scores = [], []
+    started = time.perf_counter()
+
+    def flush():
+        nonlocal features, targets, row
+        _, batch = encode_with_token_means(batch_answers)
+        if features is None:
+            features = np.lib.format.open_memmap(
+                features_path + ".tmp", mode="w+", dtype=np.float32, shape=(rows, batch.shape[1])
+            )
+            targets = np.lib.format.open_memmap(
+                targets_path + ".tmp", mode="w+", dtype=np.float32, shape=(rows,)
+            )
+        features[row:row + len(batch)] = batch
+        targets[row:row + len(batch)] = batch_scores
+        row += len(batch)
+        batch_answers.clear()
+        batch_scores.clear()
+        print(f"Encoded {row}/{rows} rows ({row / (time.perf_counter() - started):.1f} rows/s)")
+
+    for answer, score in stream_examples(path):
+        batch_answers.append(answer)
+        batch_scores.append(score)
+        if len(batch_answers) >= batch_size:
+            flush()
+    if batch_answers:
+        flush()
+
+    if features is None:
+        raise SystemExit("Dataset has no rows")
+
+    features.flush()
+    targets.flush()
+    del features, targets
+    os.replace(features_path + ".tmp", features_path)
+    os.replace(targets_path + ".tmp", targets_path)
+    return np.load(features_path, mmap_mode="r"), np.load(targets_path, mmap_mode="r")
+
+
+def fit_linear(features: np.ndarray, targets: np.ndarray, ridge: float = 0.0):
+    """
+    Least squares with an intercept, solved from X'X and X'y accumulated
+    over row chunks. Returns (weights, bias).
+    """
+    dim = features.shape[1] + 1
+    xtx = np.zeros((dim, dim), dtype=np.float64)
+    xty = np.zeros(dim, dtype=np.float64)
+
+    for start in range(0, len(features), FIT_CHUNK_ROWS):
+        x = np.asarray(features[start:start + FIT_CHUNK_ROWS], dtype=np.float64)
+        x = np.hstack([x, np.ones((len(x), 1))])
+        y = np.asarray(targets[start:start + FIT_CHUNK_ROWS], dtype=np.float64)
+        xtx += x.T @ x
+        xty += x.T @ y
+
+    if ridge:
+        xtx[:-1, :-1] += ridge * np.eye(dim - 1)
+
+    solution = np.linalg.lstsq(xtx, xty, rcond=None)[0]
+    return solution[:-1].astype(np.float32), np.float32(solution[-1])
+
+
+def evaluate(features: np.ndarray, targets: np.ndarray, weights, bias) -> dict:
+    squared, total, total_sq, count = 0.0, 0.0, 0.0, 0
+    for start in range(0, len(features), FIT_CHUNK_ROWS):
+        x = np.asarray(features[start:start + FIT_CHUNK_ROWS], dtype=np.float32)
+        y = np.asarray(targets[start:start + FIT_CHUNK_ROWS], dtype=np.float64)
+        error = x @ weights + bias - y
+        squared += float(error @ error)
+        total += float(y.sum())
+        total_sq += float(y @ y)
+        count += len(y)
+
+    variance = total_sq - total * total / count
+    return {
+        "rmse": (squared / count) ** 0.5,
+        "r2": 1 - squared / variance if variance > 0 else None,
+    }
+
+
+def write_artifact(output_dir: str, weights, bias, metadata: dict) -> str:
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"scoring_model_weights-{metadata['version']}.npz")
+    np.savez(path, weights=weights, bias=bias, metadata=np.array(json.dumps(metadata)))
+    return path
+
+
+def promote(path: str, target: str = SCORING_WEIGHTS_PATH):
+    tmp = f"{target}.{os.getpid()}.tmp"
+    shutil.copyfile(path, tmp)
+    os.replace(tmp, target)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the answer regression scorer.")
+    parser.add_argument("--data", required=True, help="jsonl with answer and score fields")
+    parser.add_argument("--output-dir", default=os.path.dirname(SCORING_WEIGHTS_PATH))
+    parser.add_argument("--cache-dir", default=os.path.join(CACHE_DIR, "training"))
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--ridge", type=float, default=0.0)
+    parser.add_argument("--promote", action="store_true",
+                        help=f"also copy the artifact to {SCORING_WEIGHTS_PATH}")
+    args = parser.parse_args(argv)
+
+    dataset_sha256, rows = dataset_fingerprint(args.data)
+    cache_path = os.path.join(args.cache_dir, f"{SENTENCE_MODEL}-{FEATURE}-{PREPROCESSING}-{dataset_sha256[:16]}")
+
+    features, targets = encode_dataset(args.data, rows, cache_path, args.batch_size)
+    weights, bias = fit_linear(features, targets, args.ridge)
+
+    metadata = {
+        "version": time.strftime("v%Y%m%d%H%M%S"),
+        "encoder": SENTENCE_MODEL,
+        "feature": FEATURE,
+        "preprocessing": PREPROCESSING,
+        "rows": rows,
+        "dataset_sha256": dataset_sha256,
+        "ridge": args.ridge,
+        "train_metrics": evaluate(features, targets, weights, bias),
+        "created_at": time.time(),
+    }
+    path = write_artifact(args.output_dir, weights, bias, metadata)
+    print(f"Wrote {path}: {json.dumps(metadata['train_metrics'])}")
+
+    if args.promote:
+        promote(path)
+        print(f"Promoted to {SCORING_WEIGHTS_PATH}")
+
+
+if __name__ == "__main__":
+    main()
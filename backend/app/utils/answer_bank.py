@@ -0,0 +1,112 @@
+import json
+import os
+import numpy as np
+from app.config import ANSWER_BANK_PATH
+from app.model_registry import SCORING_MODEL
+from app.utils.embedding_cache import text_key
+from app.utils.question_templates import question_fingerprint
+
+
+class IdealAnswerBank:
+    """
+    Read-only ideal answers precomputed for every template question by
+    app/training/build_answer_bank.py.
+    The artifact is one .npz: question fingerprints (sorted int64) index
+    into offsets of a UTF-8 answer blob, and each row's answer embedding is
+    kept alongside, keyed by the hash of its cleaned text.
+    """
+
+    def __init__(self, path: str, model_name: str):
+        self.path = path
+        self.model_name = model_name
+        self.metadata = {}
+        self.stats = {"hits": 0, "misses": 0, "embedding_hits": 0}
+        self._fingerprints = np.empty(0, dtype=np.int64)
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._blob = b""
+        self._embedding_rows = {}
+        self._embeddings = None
+
+    def __len__(self):
+        return len(self._fingerprints)
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+
+        with np.load(self.path) as data:
+            metadata = json.loads(str(data["metadata"]))
+            if metadata.get("model") != self.model_name:
+                print("ANSWER BANK SKIPPED: built with", metadata.get("model"))
+                return False
+
+            self._fingerprints = data["fingerprints"]
+            self._offsets = data["offsets"]
+            self._blob = data["answers"].tobytes()
+            self._embeddings = data["embeddings"]
+            self._embedding_rows = {
+                key.decode("ascii"): row for row, key in enumerate(data["embedding_keys"])
+            }
+        self.metadata = metadata
+        return True
+
+    def get(self, question: str):
+        fingerprint = question_fingerprint(question)
+        row = int(np.searchsorted(self._fingerprints, fingerprint))
+        if row == len(self._fingerprints) or self._fingerprints[row] != fingerprint:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        start, stop = self._offsets[row], self._offsets[row + 1]
+        return self._blob[start:stop].decode("utf-8")
+
+    def fill_embeddings(self, texts, vectors, missing):
+        """
+        Fills rows of vectors for texts listed in missing whose embedding
+        ships with the bank. Same contract as EmbeddingCache.lookup:
+        returns (vectors, positions still missing).
+        """
+        if self._embeddings is None or not missing:
+            return vectors, missing
+
+        still_missing = []
+        for i in missing:
+            row = self._embedding_rows.get(text_key(texts[i]))
+            if row is None:
+                still_missing.append(i)
+                continue
+            if vectors is None:
+                vectors = np.zeros((len(texts), self._embeddings.shape[1]), dtype=np.float32)
+            vectors[i] = self._embeddings[row]
+
+        self.stats["embedding_hits"] += len(missing) - len(still_missing)
+        return vectors, still_missing
+
+    def summary(self) -> dict:
+        return {**self.stats, "size": len(self), "version": self.metadata.get("version")}
+
+
+def write_answer_bank(path: str, questions, answers, embedding_texts, embeddings, metadata: dict):
+    fingerprints = np.array([question_fingerprint(q) for q in questions], dtype=np.int64)
+    order = np.argsort(fingerprints, kind="stable")
+
+    encoded = [answers[i].encode("utf-8") for i in order]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(a) for a in encoded])
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp.npz"
+    np.savez(
+        tmp,
+        fingerprints=fingerprints[order],
+        offsets=offsets,
+        answers=np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        embedding_keys=np.array([text_key(t).encode("ascii") for t in embedding_texts], dtype="S40"),
+        embeddings=np.asarray(embeddings, dtype=np.float32),
+        metadata=np.array(json.dumps(metadata))
+    )
+    os.replace(tmp, path)
+
+
+ANSWER_BANK = IdealAnswerBank(ANSWER_BANK_PATH, SCORING_MODEL)
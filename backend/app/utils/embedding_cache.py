@@ -0,0 +1,184 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Embedding store keyed by text hash, bounded to max_entries with LRU
+    eviction.
+    Vectors live in contiguous float32 rows so a batch of hits is a single
+    fancy-index. When a path is given the store is loaded from <path>.npy
+    (one structured array of key and vector rows, least recently used
+    first), memory-mapped copy-on-write if requested, and written back by
+    flush(). Rows added after loading go to a separate in-memory segment and
+    evicted rows are reused in place, so the loaded file is never copied
+    into RAM as a whole.
+
+    The file assumes a single writer. flush() writes the full snapshot to a
+    per-process temp file and os.replace()s it, so readers never see a
+    partial file, but when several workers share one path the last flush
+    wins and entries only the other workers had are dropped.
+    """
+
+    def __init__(self, path: str = None, mmap: bool = True, max_entries: int = 50000, flush_every: int = 256):
+        self.path = path
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._index = OrderedDict()
+        self._base = None
+        self._vectors = None
+        self._rows = 0
+        self._unsaved = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+        if path:
+            self._load(mmap)
+
+    def __len__(self):
+        return len(self._index)
+
+    @property
+    def _base_rows(self) -> int:
+        return 0 if self._base is None else len(self._base)
+
+    @property
+    def _dim(self):
+        source = self._base if self._base is not None else self._vectors
+        return None if source is None else source.shape[1]
+
+    def lookup(self, texts):
+        """
+        Returns (vectors, missing): vectors has one row per text, and
+        missing lists the positions whose rows still need encoding.
+        """
+        with self._lock:
+            rows = []
+            for t in texts:
+                key = text_key(t)
+                row = self._index.get(key)
+                if row is not None:
+                    self._index.move_to_end(key)
+                rows.append(row)
+            missing = [i for i, row in enumerate(rows) if row is None]
+            self.stats["hits"] += len(rows) - len(missing)
+            self.stats["misses"] += len(missing)
+
+            if self._dim is None:
+                return None, missing
+
+            vectors = np.zeros((len(texts), self._dim), dtype=np.float32)
+            found = [i for i, row in enumerate(rows) if row is not None]
+            if found:
+                vectors[found] = self._gather([rows[i] for i in found])
+            return vectors, missing
+
+    def store(self, texts, vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                key = text_key(text)
+                if key in self._index:
+                    self._index.move_to_end(key)
+                    continue
+
+                if len(self._index) >= self.max_entries or self._rows >= self.max_entries:
+                    _, row = self._index.popitem(last=False)
+                    self.stats["evictions"] += 1
+                else:
+                    row = self._rows
+                    self._reserve(row + 1 - self._base_rows, vector.shape[0])
+                    self._rows += 1
+
+                if row < self._base_rows:
+                    self._base[row] = vector
+                else:
+                    self._vectors[row - self._base_rows] = vector
+                self._index[key] = row
+                self._unsaved += 1
+
+        if self.path and self._unsaved >= self.flush_every:
+            self.flush()
+
+    def encode(self, texts, encoder):
+        """
+        Returns float32 embeddings for texts, calling encoder(list_of_texts)
+        only for the texts that are not cached yet.
+        """
+        vectors, missing = self.lookup(texts)
+        if missing:
+            encoded = np.asarray(encoder([texts[i] for i in missing]), dtype=np.float32)
+            if vectors is None:
+                vectors = np.zeros((len(texts), encoded.shape[1]), dtype=np.float32)
+            vectors[missing] = encoded
+            self.store([texts[i] for i in missing], encoded)
+        return vectors
+
+    def flush(self):
+        if not self.path:
+            return
+        with self._lock:
+            if not self._index or not self._unsaved:
+                return
+            records = np.empty(len(self._index), dtype=[("key", "S40"), ("vector", np.float32, (self._dim,))])
+            records["key"] = [key.encode("ascii") for key in self._index]
+            records["vector"] = self._gather(list(self._index.values()))
+            self._unsaved = 0
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, records)
+        os.replace(tmp, self.path + ".npy")
+
+    def _gather(self, rows) -> np.ndarray:
+        rows = np.asarray(rows, dtype=np.int64)
+        out = np.empty((len(rows), self._dim), dtype=np.float32)
+        in_base = rows < self._base_rows
+        if in_base.any():
+            out[in_base] = self._base[rows[in_base]]
+        if not in_base.all():
+            out[~in_base] = self._vectors[rows[~in_base] - self._base_rows]
+        return out
+
+    def _reserve(self, size: int, dim: int):
+        if self._vectors is not None and self._vectors.shape[0] >= size:
+            return
+        current = 0 if self._vectors is None else self._vectors.shape[0]
+        capacity = max(size, min(max(64, 2 * current), self.max_entries - self._base_rows))
+        grown = np.zeros((capacity, dim), dtype=np.float32)
+        if self._vectors is not None:
+            grown[:current] = self._vectors
+        self._vectors = grown
+
+    def _load(self, mmap: bool):
+        path = self.path + ".npy"
+        if not os.path.exists(path):
+            return
+
+        try:
+            records = np.load(path, mmap_mode="c" if mmap else None)
+        except (OSError, ValueError) as e:
+            print("EMBEDDING CACHE LOAD ERROR:", e)
+            return
+
+        if records.dtype.names != ("key", "vector") or not len(records):
+            return
+
+        # the file is least recently used first; keep the newest max_entries
+        start = max(0, len(records) - self.max_entries)
+        self._base = records["vector"]
+        self._rows = len(records)
+        self._index = OrderedDict(
+            (key.decode("ascii"), start + i) for i, key in enumerate(np.asarray(records["key"][start:]))
+        )
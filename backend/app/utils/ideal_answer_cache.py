@@ -1,7 +1,107 @@
-IDEAL_CACHE = {}
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from app.config import IDEAL_CACHE_PATH, IDEAL_CACHE_MAX_ENTRIES, IDEAL_CACHE_DISK_MAX_ENTRIES
+from app.model_registry import SCORING_MODEL as DEFAULT_MODEL
+from app.utils.state_store import create_state_store
 
-def get_cached_ideal_answer(question: str):
-    return IDEAL_CACHE.get(question)
+PRUNE_EVERY = 256
 
-def set_cached_ideal_answer(question: str, answer: str):
-    IDEAL_CACHE[question] = answer
+
+def normalize_question(question: str) -> str:
+    return re.sub(r"\s+", " ", question or "").strip().lower()
+
+
+def cache_key(question: str, model_name: str) -> str:
+    raw = f"{model_name}\n{normalize_question(question)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class IdealAnswerCache:
+    """
+    Two-level ideal answer cache.
+    An in-process LRU bounded by max_entries sits in front of a SQLite
+    state store shared by every worker on the host and kept across restarts.
+    """
+
+    NAMESPACE = "ideal_answers"
+
+    def __init__(self, store, max_entries: int, disk_max_entries: int):
+        self.store = store
+        self.max_entries = max_entries
+        self.disk_max_entries = disk_max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, question: str, model_name: str = DEFAULT_MODEL):
+        key = cache_key(question, model_name)
+
+        with self._lock:
+            answer = self._entries.get(key)
+            if answer is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return answer
+
+        entry = self.store.get(self.NAMESPACE, key)
+
+        with self._lock:
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["disk_hits"] += 1
+            self._remember(key, entry["answer"])
+
+        self.store.touch(self.NAMESPACE, key)
+        return entry["answer"]
+
+    def set(self, question: str, answer: str, model_name: str = DEFAULT_MODEL):
+        key = cache_key(question, model_name)
+
+        with self._lock:
+            self._remember(key, answer)
+            self._writes += 1
+            prune = self._writes % PRUNE_EVERY == 0
+
+        self.store.set(self.NAMESPACE, key, {
+            "model": model_name,
+            "question": normalize_question(question),
+            "answer": answer
+        })
+        if prune:
+            self.store.prune(self.NAMESPACE, self.disk_max_entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        self.store.prune(self.NAMESPACE, 0)
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {**self.stats, "size": len(self._entries), "max_entries": self.max_entries}
+
+    def _remember(self, key: str, answer: str):
+        self._entries[key] = answer
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+
+IDEAL_CACHE = IdealAnswerCache(
+    create_state_store("sqlite", IDEAL_CACHE_PATH),
+    IDEAL_CACHE_MAX_ENTRIES,
+    IDEAL_CACHE_DISK_MAX_ENTRIES
+)
+
+def get_cached_ideal_answer(question: str, model_name: str = DEFAULT_MODEL):
+    return IDEAL_CACHE.get(question, model_name)
+
+def set_cached_ideal_answer(question: str, answer: str, model_name: str = DEFAULT_MODEL):
+    IDEAL_CACHE.set(question, answer, model_name)
+
+def ideal_cache_stats():
+    return IDEAL_CACHE.summary()
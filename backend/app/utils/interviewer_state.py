@@ -1,17 +1,28 @@
-INTERVIEWER_STATE = {}
+from app.config import STATE_TTL_SECONDS
+from app.utils.reaction_channel import REACTIONS
+from app.utils.state_store import STATE
+
+NAMESPACE = "interviewer_reactions"
 
 def init_interviewer(session_id):
-    INTERVIEWER_STATE[session_id] = []
+    STATE.set(NAMESPACE, session_id, [], ttl=STATE_TTL_SECONDS)
     
 def add_reaction(session_id, reaction):
-    if session_id in INTERVIEWER_STATE:
-        INTERVIEWER_STATE[session_id].append(reaction)
+    """
+    Numbers each reaction with its 1-based position in the session's log
+    ("seq"), which the reaction stream uses as the SSE event id.
+    """
+    def append(reactions):
+        return reactions + [{**reaction, "seq": len(reactions) + 1}]
+
+    reactions = STATE.update(NAMESPACE, session_id, append, default=[], ttl=STATE_TTL_SECONDS)
+    REACTIONS.publish(session_id, reactions[-1])
         
 def get_reactions(session_id):
-    return INTERVIEWER_STATE.get(session_id, [])
+    return STATE.get(NAMESPACE, session_id, [])
 
 def clear_reactions(session_id: int):
-    INTERVIEWER_STATE.pop(session_id, None)
+    STATE.delete(NAMESPACE, session_id)
 
 def clear_interviewer(session_id):
-    INTERVIEWER_STATE.pop(session_id, None)
\ No newline at end of file
+    STATE.delete(NAMESPACE, session_id)
@@ -0,0 +1,88 @@
+import re
+from bisect import bisect_right
+
+
+def _trie_pattern(keywords) -> str:
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # greedy optional tail: the longest keyword at a position wins
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def fold_case(text: str) -> str:
+    """
+    Lowercases text without changing its length, so match offsets still
+    index the original string.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
+
+
+class KeywordMatcher:
+    """
+    Finds every keyword of every group in one pass over the text.
+    All keywords are compiled into a single zero-width lookahead over a
+    prefix trie, so the per-position cost barely grows with the taxonomy and
+    overlapping occurrences are still reported, which keeps the substring
+    semantics of `keyword in text`. A keyword that is a prefix of a longer
+    one (java / javascript) is credited whenever the longer one hits.
+    Matching is case-insensitive.
+    """
+
+    def __init__(self, groups: dict):
+        self.groups = {}
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                self.groups.setdefault(keyword.lower(), set()).add(group)
+
+        self._pattern = re.compile("(?=(" + _trie_pattern(self.groups) + "))")
+        self._prefixes = {
+            k: [p for p in self.groups if p != k and k.startswith(p)]
+            for k in self.groups
+        }
+
+    def find(self, text: str):
+        """
+        Yields (position, keyword) for every keyword occurrence.
+        """
+        for match in self._pattern.finditer(fold_case(text)):
+            keyword = match.group(1)
+            yield match.start(), keyword
+            for prefix in self._prefixes[keyword]:
+                yield match.start(), prefix
+
+    def keywords_by_group(self, text: str) -> dict:
+        """
+        Returns {group: set of distinct keywords found} for every group.
+        """
+        found = {group: set() for keywords in self.groups.values() for group in keywords}
+        for _, keyword in self.find(text):
+            for group in self.groups[keyword]:
+                found[group].add(keyword)
+        return found
+
+    def groups_by_segment(self, text: str, starts: list) -> list:
+        """
+        starts are the sorted offsets where segments of text begin.
+        Returns one set of hit groups per segment.
+        """
+        hits = [set() for _ in starts]
+        for position, keyword in self.find(text):
+            segment = bisect_right(starts, position) - 1
+            if segment >= 0:
+                hits[segment] |= self.groups[keyword]
+        return hits
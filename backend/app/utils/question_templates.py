@@ -0,0 +1,187 @@
+import hashlib
+import random
+import re
+
+CORE_TEMPLATES = [
+    "Tell me about a time you had to overcome a major challenge while {experience}.",
+    "What was the most difficult decision you made during {experience}?",
+    "Looking back, what would you do differently in {experience}?",
+    "What did you learn personally and professionally from {experience}?",
+    "How did you measure success in {experience}?",
+    "What risks were involved in {experience}, and how did you handle them?",
+    "How did you prioritize tasks during {experience}?",
+    "What surprised you the most while working on {experience}?",
+    "How did this experience shape your future approach to similar work?",
+    "What was the biggest mistake you made during {experience}, and what did it teach you?"
+]
+
+TECHNICAL_TEMPLATES = [
+    "How did you design the architecture for {experience}?",
+    "What technical trade-offs did you consider during {experience}?",
+    "How did you debug or troubleshoot issues in {experience}?",
+    "What performance optimizations did you implement in {experience}?",
+    "How did you ensure scalability or reliability in {experience}?",
+    "What technologies did you choose for {experience}, and why?",
+    "How did you handle failures or edge cases in {experience}?",
+    "What was the most complex technical problem in {experience}?",
+    "How did you test and validate your solution in {experience}?",
+    "If you rebuilt {experience} today, what would you change technically?",
+    "How did collaboration with other developers impact {experience}?",
+    "What security considerations were important in {experience}?",
+    "How did you manage database or API design in {experience}?",
+    "What bottlenecks did you encounter in {experience} and how did you fix them?",
+    "How did you ensure code quality during {experience}?"
+]
+
+HR_TEMPLATES = [
+    "How did you handle conflict between team members during {experience}?",
+    "What communication strategy worked best in {experience}?",
+    "How did you motivate others while managing {experience}?",
+    "What challenges did you face with stakeholder expectations in {experience}?",
+    "How did you build trust within the team during {experience}?",
+    "What difficult conversation did you have during {experience}?",
+    "How did you ensure fairness and inclusion in {experience}?",
+    "What feedback did you receive during {experience}, and how did you respond?",
+    "How did you manage stress or pressure in {experience}?",
+    "What leadership qualities did you demonstrate in {experience}?"
+]
+
+MANAGERIAL_TEMPLATES = [
+    "How did you plan and execute {experience} from start to finish?",
+    "What strategic decisions were critical in {experience}?",
+    "How did you allocate resources during {experience}?",
+    "What risks threatened {experience}, and how did you mitigate them?",
+    "How did you track progress and performance in {experience}?",
+    "What trade-offs did you make between speed, cost, and quality in {experience}?",
+    "How did you align stakeholders during {experience}?",
+    "What would you improve in your leadership approach after {experience}?",
+    "How did you handle uncertainty or changing requirements in {experience}?",
+    "What impact did {experience} create for the organization?"
+]
+
+COLLABORATION_TEMPLATES = [
+    "How did you collaborate with others during {experience}?",
+    "How did you handle disagreements or differing opinions in {experience}?",
+    "How did you communicate progress or issues during {experience}?",
+    "What role did you personally play in {experience}?"
+]
+
+LEADERSHIP_TEMPLATES = [
+    "How did you plan and execute {experience}?",
+    "How did you prioritize tasks during {experience}?",
+    "What risks did you identify in {experience}, and how did you manage them?",
+    "How did you make decisions under pressure during {experience}?",
+    "How did you take ownership of outcomes in {experience}?"
+]
+
+REFLECTIVE_TEMPLATES = [
+    "What would you do differently if you faced {experience} again?",
+    "What was the biggest lesson from {experience}?",
+    "How did {experience} influence your professional growth?"
+]
+
+GENERIC_QUESTIONS = [
+    "Can you describe a challenging project and how you solved it?",
+    "What key decision shaped one of your projects?",
+    "How do you approach problems when requirements are unclear?",
+    "What mistake taught you the most?",
+    "How do you balance quality and deadlines?"
+]
+
+CATEGORY_TEMPLATES = {
+    "IT": TECHNICAL_TEMPLATES + CORE_TEMPLATES + REFLECTIVE_TEMPLATES,
+    "HR": HR_TEMPLATES + COLLABORATION_TEMPLATES + CORE_TEMPLATES,
+    "Managerial": MANAGERIAL_TEMPLATES + LEADERSHIP_TEMPLATES + CORE_TEMPLATES,
+    "General": CORE_TEMPLATES + REFLECTIVE_TEMPLATES,
+}
+
+PERSONALITY_TONES = {
+    "technical": {
+        "tone": "Be specific and focus on technical depth."
+    },
+    "mentor": {
+        "tone": "Explain clearly and include what you learned."
+    },
+    "hr": {
+        "tone": "Focus on communication, teamwork, and behavior."
+    },
+    "manager": {
+        "tone": "Justify decisions and business impact."
+    }
+}
+
+STANDARD_ENDINGS = ("Please elaborate.", "Give a real example.", "Explain your reasoning.")
+
+HOW_REWRITE_CHANCE = 0.3
+WHAT_REWRITE_CHANCE = 0.2
+
+
+def _rewrite_variants(template: str) -> tuple:
+    how = template.replace("How did you", "Can you explain how you")
+    return (
+        template,
+        how,
+        template.replace("What", "Could you describe what"),
+        how.replace("What", "Could you describe what"),
+    )
+
+
+def question_fingerprint(question: str) -> int:
+    normalized = re.sub(r"\s+", " ", question).strip().lower()
+    digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class QuestionTemplateEngine:
+    """
+    Question templates compiled once per category and personality.
+    Every template is stored with its four phrasing rewrites precomputed,
+    and every personality with its tuple of closing sentences, so drawing
+    a question only indexes into tuples. Dedup works on 64-bit fingerprints
+    of the question with its closing sentence stripped.
+    """
+
+    def __init__(self, category_templates: dict, personalities: dict, generic_questions: list):
+        self.templates = {
+            category: tuple(_rewrite_variants(t) for t in templates)
+            for category, templates in category_templates.items()
+        }
+        self.endings = {
+            name: ((config["tone"],) + STANDARD_ENDINGS) if config.get("tone") else ()
+            for name, config in personalities.items()
+        }
+        self.generic_questions = tuple(generic_questions)
+
+        suffixes = {ending for endings in self.endings.values() for ending in endings}
+        self._suffix_pattern = re.compile(
+            r"\s+(?:" + "|".join(re.escape(s) for s in sorted(suffixes, key=len, reverse=True)) + r")$"
+        ) if suffixes else None
+
+    def category_templates(self, category: str) -> tuple:
+        return self.templates.get(category) or self.templates["General"]
+
+    def pick_template(self, rng: random.Random, category: str) -> str:
+        variants = rng.choice(self.category_templates(category))
+        how = rng.random() < HOW_REWRITE_CHANCE
+        what = rng.random() < WHAT_REWRITE_CHANCE
+        return variants[how + 2 * what]
+
+    def apply_tone(self, rng: random.Random, question: str, personality: str) -> str:
+        endings = self.endings.get(personality)
+        if not endings:
+            return question
+        return f"{question} {rng.choice(endings)}"
+
+    def strip_tone(self, question: str) -> str:
+        if self._suffix_pattern is None:
+            return question
+        return self._suffix_pattern.sub("", question.strip())
+
+    def fingerprint(self, question: str) -> int:
+        return question_fingerprint(self.strip_tone(question))
+
+    def fingerprints(self, questions) -> set:
+        return {self.fingerprint(q) for q in questions if q}
+
+
+QUESTION_ENGINE = QuestionTemplateEngine(CATEGORY_TEMPLATES, PERSONALITY_TONES, GENERIC_QUESTIONS)
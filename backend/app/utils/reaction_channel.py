@@ -0,0 +1,158 @@
+import asyncio
+import json
+import select
+import threading
+import time
+from app.config import REACTION_BROKER, REACTION_HEARTBEAT_SECONDS
+
+
+class InProcessReactionBroker:
+    """
+    Per-session pub/sub for interviewer reactions within one process.
+    publish() may be called from any thread; subscribers are async
+    generators running on an event loop.
+    """
+
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def publish(self, session_id, reaction: dict):
+        self.dispatch(session_id, reaction)
+
+    def dispatch(self, session_id, reaction: dict):
+        with self._lock:
+            subscribers = list(self._subscribers.get(str(session_id), ()))
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, reaction)
+
+    async def subscribe(self, session_id, heartbeat: float = REACTION_HEARTBEAT_SECONDS, replay=None):
+        """
+        Yields reactions for session_id as they are published, and None
+        every `heartbeat` seconds without one so callers can keep the
+        connection alive. replay(), if given, is called once the
+        subscription is registered and its items are yielded first, so
+        nothing published in between is missed (it may be seen twice).
+        """
+        entry = (asyncio.get_running_loop(), asyncio.Queue())
+        key = str(session_id)
+
+        with self._lock:
+            self._subscribers.setdefault(key, set()).add(entry)
+        try:
+            if replay is not None:
+                for reaction in replay():
+                    yield reaction
+
+            while True:
+                try:
+                    yield await asyncio.wait_for(entry[1].get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(key)
+                if subscribers is not None:
+                    subscribers.discard(entry)
+                    if not subscribers:
+                        self._subscribers.pop(key, None)
+
+
+class PostgresReactionBroker(InProcessReactionBroker):
+    """
+    Fans reactions out to every worker process through PostgreSQL
+    LISTEN/NOTIFY. Each process keeps one listening connection and
+    dispatches notifications to its local subscribers.
+    """
+
+    CHANNEL = "interviewer_reactions"
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.dsn = psycopg2_dsn(url)
+        self._publish_conn = None
+        self._publish_lock = threading.Lock()
+        self._listener = None
+
+    def publish(self, session_id, reaction: dict):
+        import psycopg2
+
+        payload = json.dumps({"session_id": str(session_id), "reaction": reaction}, default=str)
+
+        with self._publish_lock:
+            for attempt in range(2):
+                try:
+                    if self._publish_conn is None or self._publish_conn.closed:
+                        self._publish_conn = psycopg2.connect(self.dsn)
+                        self._publish_conn.autocommit = True
+                    with self._publish_conn.cursor() as cur:
+                        cur.execute("SELECT pg_notify(%s, %s)", (self.CHANNEL, payload))
+                    return
+                except psycopg2.OperationalError:
+                    self._publish_conn = None
+                    if attempt:
+                        raise
+
+    async def subscribe(self, session_id, heartbeat: float = REACTION_HEARTBEAT_SECONDS, replay=None):
+        self._ensure_listener()
+        async for reaction in super().subscribe(session_id, heartbeat, replay):
+            yield reaction
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen_forever, name="reaction-listener", daemon=True)
+                self._listener.start()
+
+    def _listen_forever(self):
+        while True:
+            try:
+                self._listen()
+            except Exception as e:
+                print("REACTION LISTENER ERROR:", e)
+                time.sleep(1)
+
+    def _listen(self):
+        import psycopg2
+
+        conn = psycopg2.connect(self.dsn)
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {self.CHANNEL}")
+
+            while True:
+                if select.select([conn], [], [], 5) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    message = json.loads(notify.payload)
+                    self.dispatch(message["session_id"], message["reaction"])
+        finally:
+            conn.close()
+
+
+def psycopg2_dsn(url: str) -> str:
+    """
+    libpq connection string for a SQLAlchemy PostgreSQL URL, with any
+    driver suffix (postgresql+psycopg2, postgresql+asyncpg) dropped.
+    """
+    from sqlalchemy.engine import make_url
+
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "postgresql":
+        raise ValueError(
+            f"REACTION_BROKER=postgres needs a PostgreSQL DATABASE_URL, got {parsed.get_backend_name()}"
+        )
+    return parsed.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+def create_reaction_broker(kind: str = REACTION_BROKER):
+    if kind == "postgres":
+        from app.database import SQLALCHEMY_DATABASE_URL
+        return PostgresReactionBroker(SQLALCHEMY_DATABASE_URL)
+    return InProcessReactionBroker()
+
+
+REACTIONS = create_reaction_broker()
@@ -0,0 +1,122 @@
+import json
+import os
+import re
+import threading
+import numpy as np
+from app.config import RESUME_CACHE_DIR, RESUME_CACHE_MAX_BYTES
+
+SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class ResumeArtifactCache:
+    """
+    Content-addressed on-disk cache of processed resumes.
+    Each PDF's SHA-256 maps to <sha>.json (extracted text, normalized text,
+    signals, category) and optionally <sha>.npy (resume embedding). Reads
+    bump the file mtime; once the directory grows past max_bytes the least
+    recently used artifacts are deleted.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._total_bytes = sum(size for _, _, size in self._scan())
+
+    def _path(self, sha256: str, suffix: str) -> str:
+        if not SHA256_PATTERN.match(sha256):
+            raise ValueError("Invalid resume hash")
+        return os.path.join(self.directory, sha256 + suffix)
+
+    def _scan(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def get(self, sha256: str):
+        path = self._path(sha256, ".json")
+        try:
+            with open(path, encoding="utf-8") as f:
+                artifact = json.load(f)
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return artifact
+
+    def get_embedding(self, sha256: str):
+        path = self._path(sha256, ".npy")
+        try:
+            return np.load(path)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put(self, sha256: str, artifact: dict, embedding=None):
+        written = self._write(self._path(sha256, ".json"), json.dumps(artifact).encode("utf-8"))
+        if embedding is not None:
+            written += self.put_embedding(sha256, embedding, evict=False)
+
+        with self._lock:
+            self._total_bytes += written
+        self._evict()
+
+    def put_embedding(self, sha256: str, embedding, evict: bool = True) -> int:
+        path = self._path(sha256, ".npy")
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, np.asarray(embedding, dtype=np.float32))
+        written = os.path.getsize(tmp)
+        os.replace(tmp, path)
+
+        if evict:
+            with self._lock:
+                self._total_bytes += written
+            self._evict()
+        return written
+
+    def _write(self, path: str, data: bytes) -> int:
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        return len(data)
+
+    def _evict(self):
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+
+            groups = {}
+            for mtime, path, size in self._scan():
+                stem = os.path.basename(path).split(".", 1)[0]
+                last_used, paths, total = groups.get(stem, (0, [], 0))
+                groups[stem] = (max(last_used, mtime), paths + [path], total + size)
+
+            total = sum(size for _, _, size in groups.values())
+            for _, paths, size in sorted(groups.values()):
+                if total <= self.max_bytes * 0.9:
+                    break
+                for path in paths:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                total -= size
+                self.stats["evictions"] += 1
+            self._total_bytes = total
+
+    def summary(self) -> dict:
+        return {**self.stats, "bytes": self._total_bytes, "max_bytes": self.max_bytes}
+
+
+RESUME_CACHE = ResumeArtifactCache(RESUME_CACHE_DIR, RESUME_CACHE_MAX_BYTES)
@@ -1,26 +1,27 @@
-def detect_resume_category(text: str) -> str:
-    text = text.lower()
+from app.utils.keyword_matcher import KeywordMatcher
 
-    it_keywords = [
+CATEGORY_KEYWORDS = {
+    "IT": [
         "python", "java", "javascript", "react", "node", "sql",
         "machine learning", "deep learning", "api", "backend", "frontend",
         "docker", "kubernetes", "cloud", "aws", "azure", "devops"
-    ]
-
-    hr_keywords = [
+    ],
+    "HR": [
         "recruitment", "talent", "hr", "human resource",
         "payroll", "onboarding", "compliance", "employee relations"
-    ]
-
-    managerial_keywords = [
+    ],
+    "Managerial": [
         "manager", "leadership", "team lead", "project management",
         "stakeholder", "strategy", "planning", "execution"
-    ]
+    ],
+}
 
-    scores = {
-        "IT": sum(k in text for k in it_keywords),
-        "HR": sum(k in text for k in hr_keywords),
-        "Managerial": sum(k in text for k in managerial_keywords),
-    }
+CATEGORY_MATCHER = KeywordMatcher(CATEGORY_KEYWORDS)
 
+def category_scores(text: str) -> dict:
+    found = CATEGORY_MATCHER.keywords_by_group(text)
+    return {category: len(found[category]) for category in CATEGORY_KEYWORDS}
+
+def detect_resume_category(text: str) -> str:
+    scores = category_scores(text)
     return max(scores, key=scores.get) if max(scores.values()) > 0 else "General"
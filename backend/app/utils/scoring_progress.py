@@ -1,14 +1,22 @@
-SCORING_PROGRESS = {}
+from app.config import STATE_TTL_SECONDS
+from app.utils.state_store import STATE
+
+NAMESPACE = "scoring_progress"
+
+def _advance(progress):
+    if progress is None:
+        return None
+    progress["current"] += 1
+    return progress
 
 def init_progress(session_id: int, total: int):
-    SCORING_PROGRESS[session_id] = {"current": 0, "total": total}
+    STATE.set(NAMESPACE, session_id, {"current": 0, "total": total}, ttl=STATE_TTL_SECONDS)
 
 def update_progress(session_id: int):
-    if session_id in SCORING_PROGRESS:
-        SCORING_PROGRESS[session_id]["current"] += 1
+    STATE.update(NAMESPACE, session_id, _advance, ttl=STATE_TTL_SECONDS)
 
 def get_progress(session_id: int):
-    return SCORING_PROGRESS.get(session_id, {"current": 0, "total": 0})
+    return STATE.get(NAMESPACE, session_id, {"current": 0, "total": 0})
 
 def clear_progress(session_id: int):
-    SCORING_PROGRESS.pop(session_id, None)
+    STATE.delete(NAMESPACE, session_id)
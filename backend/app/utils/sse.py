@@ -0,0 +1,7 @@
+import json
+
+KEEPALIVE = ": keepalive\n\n"
+
+def format_sse(event: str, data: dict, event_id=None) -> str:
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -0,0 +1,191 @@
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+from app.config import STATE_STORE, STATE_STORE_PATH
+
+PURGE_EVERY = 500
+
+
+class MemoryStateStore:
+    """
+    Namespaced key/value store with optional per-entry TTL, local to one
+    process. Values must be JSON-serializable so the store can be swapped
+    for SQLiteStateStore without changing callers.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.RLock()
+        self._writes = 0
+
+    def get(self, namespace: str, key, default=None):
+        with self._lock:
+            entry = self._data.get((namespace, str(key)))
+            if entry is None:
+                return default
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[(namespace, str(key))]
+                return default
+            return copy.deepcopy(value)
+
+    def set(self, namespace: str, key, value, ttl: float = None):
+        with self._lock:
+            now = time.time()
+            self._data[(namespace, str(key))] = (
+                copy.deepcopy(value),
+                now + ttl if ttl else None,
+                now
+            )
+            self._writes += 1
+            if self._writes % PURGE_EVERY == 0:
+                self.purge_expired()
+
+    def delete(self, namespace: str, key):
+        with self._lock:
+            self._data.pop((namespace, str(key)), None)
+
+    def update(self, namespace: str, key, fn, default=None, ttl: float = None):
+        """
+        Atomically replaces the value with fn(current) and returns it.
+        Missing keys pass `default` to fn. Returning None from fn leaves the
+        entry untouched.
+        """
+        with self._lock:
+            value = fn(self.get(namespace, key, copy.deepcopy(default)))
+            if value is not None:
+                self.set(namespace, key, value, ttl)
+            return value
+
+    def append(self, namespace: str, key, item, ttl: float = None):
+        return self.update(namespace, key, lambda items: items + [item], default=[], ttl=ttl)
+
+    def touch(self, namespace: str, key):
+        with self._lock:
+            entry = self._data.get((namespace, str(key)))
+            if entry is not None:
+                self._data[(namespace, str(key))] = (entry[0], entry[1], time.time())
+
+    def prune(self, namespace: str, max_entries: int):
+        with self._lock:
+            keys = sorted(
+                (k for k in self._data if k[0] == namespace),
+                key=lambda k: self._data[k][2],
+                reverse=True
+            )
+            for k in keys[max_entries:]:
+                del self._data[k]
+
+    def purge_expired(self):
+        with self._lock:
+            now = time.time()
+            for k in [k for k, (_, expires_at, _) in self._data.items() if expires_at is not None and expires_at <= now]:
+                del self._data[k]
+
+
+class SQLiteStateStore:
+    """
+    The same interface backed by a SQLite file (WAL mode), so every worker
+    process on the host sees the same state. Each thread gets its own
+    connection; update() runs inside BEGIN IMMEDIATE so concurrent
+    read-modify-write calls from different processes serialize.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS state ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "expires_at REAL, updated_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_state_expires_at ON state (expires_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_state_updated_at ON state (namespace, updated_at)")
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _read(self, conn, namespace, key, default):
+        row = conn.execute(
+            "SELECT value, expires_at FROM state WHERE namespace = ? AND key = ?",
+            (namespace, str(key))
+        ).fetchone()
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return default
+        return json.loads(row[0])
+
+    def _write(self, conn, namespace, key, value, ttl):
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO state (namespace, key, value, expires_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (namespace, str(key), json.dumps(value), now + ttl if ttl else None, now)
+        )
+        self._writes += 1
+        if self._writes % PURGE_EVERY == 0:
+            conn.execute("DELETE FROM state WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+
+    def get(self, namespace: str, key, default=None):
+        return self._read(self._conn(), namespace, key, default)
+
+    def set(self, namespace: str, key, value, ttl: float = None):
+        self._write(self._conn(), namespace, key, value, ttl)
+
+    def delete(self, namespace: str, key):
+        self._conn().execute("DELETE FROM state WHERE namespace = ? AND key = ?", (namespace, str(key)))
+
+    def update(self, namespace: str, key, fn, default=None, ttl: float = None):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            value = fn(self._read(conn, namespace, key, copy.deepcopy(default)))
+            if value is not None:
+                self._write(conn, namespace, key, value, ttl)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return value
+
+    def append(self, namespace: str, key, item, ttl: float = None):
+        return self.update(namespace, key, lambda items: items + [item], default=[], ttl=ttl)
+
+    def touch(self, namespace: str, key):
+        self._conn().execute(
+            "UPDATE state SET updated_at = ? WHERE namespace = ? AND key = ?",
+            (time.time(), namespace, str(key))
+        )
+
+    def prune(self, namespace: str, max_entries: int):
+        self._conn().execute(
+            "DELETE FROM state WHERE namespace = ? AND key IN ("
+            "SELECT key FROM state WHERE namespace = ? ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+            (namespace, namespace, max_entries)
+        )
+
+    def purge_expired(self):
+        self._conn().execute(
+            "DELETE FROM state WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        )
+
+
+def create_state_store(kind: str = STATE_STORE, path: str = STATE_STORE_PATH):
+    if kind == "sqlite":
+        return SQLiteStateStore(path)
+    return MemoryStateStore()
+
+
+STATE = create_state_store()
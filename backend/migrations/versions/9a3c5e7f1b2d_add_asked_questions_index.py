@@ -0,0 +1,88 @@
+"""add asked questions index
+
+Revision ID: 9a3c5e7f1b2d
+Revises: 4de7f41c4835
+Create Date: 2026-10-18 10:12:31.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.question_templates import QUESTION_ENGINE
+
+
+revision: str = '9a3c5e7f1b2d'
+down_revision: Union[str, Sequence[str], None] = '4de7f41c4835'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('asked_questions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('question_hash', sa.BigInteger(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_asked_questions_user_hash', 'asked_questions', ['user_id', 'question_hash'], unique=True)
+
+    backfill_asked_questions()
+
+
+def backfill_asked_questions() -> None:
+    """Copy interview_sessions.asked_questions into asked_questions as fingerprints."""
+    bind = op.get_bind()
+    columns = {c['name'] for c in sa.inspect(bind).get_columns('interview_sessions')}
+    if 'asked_questions' not in columns:
+        return
+
+    sessions = sa.table('interview_sessions',
+        sa.column('id', sa.Integer()),
+        sa.column('user_id', sa.Integer()),
+        sa.column('asked_questions', sa.JSON()),
+        sa.column('created_at', sa.DateTime()),
+    )
+    asked = sa.table('asked_questions',
+        sa.column('user_id', sa.Integer()),
+        sa.column('question_hash', sa.BigInteger()),
+        sa.column('session_id', sa.Integer()),
+        sa.column('created_at', sa.DateTime()),
+    )
+
+    seen = set()
+    batch = []
+    result = bind.execution_options(stream_results=True).execute(
+        sa.select(sessions.c.id, sessions.c.user_id, sessions.c.asked_questions, sessions.c.created_at)
+        .order_by(sessions.c.id)
+    )
+    for session_id, user_id, questions, created_at in result:
+        for fingerprint in QUESTION_ENGINE.fingerprints(questions or []):
+            if (user_id, fingerprint) in seen:
+                continue
+            seen.add((user_id, fingerprint))
+            batch.append({
+                'user_id': user_id,
+                'question_hash': fingerprint,
+                'session_id': session_id,
+                'created_at': created_at,
+            })
+
+        if len(batch) >= BACKFILL_BATCH:
+            bind.execute(asked.insert(), batch)
+            batch = []
+
+    if batch:
+        bind.execute(asked.insert(), batch)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_asked_questions_user_hash', table_name='asked_questions')
+    op.drop_table('asked_questions')
@@ -0,0 +1,26 @@
+"""add sessions user created index
+
+Revision ID: c41d8e2a6f93
+Revises: 9a3c5e7f1b2d
+Create Date: 2026-10-18 17:02:44.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'c41d8e2a6f93'
+down_revision: Union[str, Sequence[str], None] = '9a3c5e7f1b2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_interview_sessions_user_created', 'interview_sessions', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_interview_sessions_user_created', table_name='interview_sessions')
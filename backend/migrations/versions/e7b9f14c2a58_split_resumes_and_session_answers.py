@@ -0,0 +1,273 @@
+"""split resumes and session answers
+
+Revision ID: e7b9f14c2a58
+Revises: c41d8e2a6f93
+Create Date: 2026-10-18 17:31:09.774215
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e7b9f14c2a58'
+down_revision: Union[str, Sequence[str], None] = 'c41d8e2a6f93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH = 1000
+
+resumes = sa.table('resumes',
+    sa.column('id', sa.Integer()),
+    sa.column('content_hash', sa.String()),
+    sa.column('text', sa.Text()),
+    sa.column('created_at', sa.DateTime()),
+)
+answers = sa.table('session_answers',
+    sa.column('session_id', sa.Integer()),
+    sa.column('position', sa.Integer()),
+    sa.column('question', sa.Text()),
+    sa.column('answer', sa.Text()),
+    sa.column('score', sa.Integer()),
+    sa.column('technical', sa.Integer()),
+    sa.column('clarity', sa.Integer()),
+    sa.column('communication', sa.Integer()),
+    sa.column('why_lost', sa.JSON()),
+    sa.column('followup_question', sa.Text()),
+    sa.column('created_at', sa.DateTime()),
+)
+sessions = sa.table('interview_sessions',
+    sa.column('id', sa.Integer()),
+    sa.column('resume_id', sa.Integer()),
+    sa.column('resume_text', sa.String()),
+    sa.column('generated_questions', sa.JSON()),
+    sa.column('user_answers', sa.JSON()),
+    sa.column('feedback', sa.JSON()),
+    sa.column('asked_questions', sa.JSON()),
+    sa.column('score', sa.Integer()),
+    sa.column('created_at', sa.DateTime()),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('resumes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('content_hash')
+    )
+    op.create_table('session_answers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('question', sa.Text(), nullable=False),
+    sa.Column('answer', sa.Text(), nullable=False),
+    sa.Column('score', sa.Integer(), nullable=True),
+    sa.Column('technical', sa.Integer(), nullable=True),
+    sa.Column('clarity', sa.Integer(), nullable=True),
+    sa.Column('communication', sa.Integer(), nullable=True),
+    sa.Column('why_lost', sa.JSON(), nullable=True),
+    sa.Column('followup_question', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['session_id'], ['interview_sessions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_session_answers_session_position', 'session_answers', ['session_id', 'position'], unique=True)
+
+    with op.batch_alter_table('interview_sessions') as batch_op:
+        batch_op.add_column(sa.Column('resume_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_interview_sessions_resume_id', 'resumes', ['resume_id'], ['id'])
+        batch_op.create_index('ix_interview_sessions_resume_id', ['resume_id'], unique=False)
+
+    backfill()
+
+    # asked_questions was only ever created by create_all, never by a
+    # migration, so databases built from the migrations do not have it
+    columns = session_columns()
+    with op.batch_alter_table('interview_sessions') as batch_op:
+        batch_op.drop_column('resume_text')
+        batch_op.drop_column('user_answers')
+        batch_op.drop_column('feedback')
+        if 'asked_questions' in columns:
+            batch_op.drop_column('asked_questions')
+
+
+def session_columns() -> set:
+    return {c['name'] for c in sa.inspect(op.get_bind()).get_columns('interview_sessions')}
+
+
+def _question_text(question) -> str:
+    return question.get('question', '') if isinstance(question, dict) else str(question or '')
+
+
+def _answer_rows(session_id, user_answers, feedback, created_at) -> list:
+    feedback = feedback if isinstance(feedback, dict) else {}
+    details = feedback.get('details') or []
+    followups = feedback.get('followup_questions') or []
+
+    rows = []
+    for position, item in enumerate(user_answers or []):
+        item = item if isinstance(item, dict) else {}
+        scored = details[position] if position < len(details) and isinstance(details[position], dict) else {}
+        breakdown = scored.get('breakdown') or {}
+        followup = followups[position] if position < len(followups) and isinstance(followups[position], dict) else {}
+        rows.append({
+            'session_id': session_id,
+            'position': position,
+            'question': _question_text(item.get('question')),
+            'answer': item.get('answer') or '',
+            'score': scored.get('score'),
+            'technical': breakdown.get('technical'),
+            'clarity': breakdown.get('clarity'),
+            'communication': breakdown.get('communication'),
+            'why_lost': scored.get('why_lost'),
+            'followup_question': followup.get('followup_question'),
+            'created_at': created_at,
+        })
+    return rows
+
+
+def backfill() -> None:
+    """
+    Move resume_text into resumes (one row per distinct text) and
+    user_answers / feedback details into session_answers, in batches.
+    """
+    bind = op.get_bind()
+    resume_ids = {}
+
+    def flush(batch):
+        new = {}
+        for _, content_hash, text, created_at, _, _ in batch:
+            if content_hash not in resume_ids and content_hash not in new:
+                new[content_hash] = {'content_hash': content_hash, 'text': text, 'created_at': created_at}
+        if new:
+            bind.execute(resumes.insert(), list(new.values()))
+            resume_ids.update(bind.execute(
+                sa.select(resumes.c.content_hash, resumes.c.id)
+                .where(resumes.c.content_hash.in_(list(new)))
+            ).all())
+
+        bind.execute(
+            sessions.update()
+            .where(sessions.c.id == sa.bindparam('session_id'))
+            .values(resume_id=sa.bindparam('new_resume_id'), score=sa.bindparam('new_score')),
+            [
+                {'session_id': session_id, 'new_resume_id': resume_ids[content_hash], 'new_score': score}
+                for session_id, content_hash, _, _, score, _ in batch
+            ]
+        )
+
+        rows = [row for *_, answer_rows in batch for row in answer_rows]
+        if rows:
+            bind.execute(answers.insert(), rows)
+
+    # keyset pages rather than one streamed cursor: every page rewrites the
+    # rows it just read
+    last_id = 0
+    while True:
+        page = bind.execute(
+            sa.select(
+                sessions.c.id, sessions.c.resume_text, sessions.c.user_answers,
+                sessions.c.feedback, sessions.c.score, sessions.c.created_at
+            )
+            .where(sessions.c.id > last_id)
+            .order_by(sessions.c.id)
+            .limit(BACKFILL_BATCH)
+        ).all()
+        if not page:
+            break
+
+        batch = []
+        for session_id, text, user_answers, feedback, score, created_at in page:
+            text = text or ''
+            if score is None and isinstance(feedback, dict) and isinstance(feedback.get('score'), (int, float)):
+                score = int(feedback['score'])
+            batch.append((
+                session_id,
+                hashlib.sha256(text.encode('utf-8')).hexdigest(),
+                text,
+                created_at,
+                score,
+                _answer_rows(session_id, user_answers, feedback, created_at),
+            ))
+        flush(batch)
+        last_id = page[-1][0]
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    restore_asked = 'asked_questions' not in session_columns()
+    with op.batch_alter_table('interview_sessions') as batch_op:
+        batch_op.add_column(sa.Column('resume_text', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('user_answers', sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column('feedback', sa.JSON(), nullable=True))
+        if restore_asked:
+            batch_op.add_column(sa.Column('asked_questions', sa.JSON(), nullable=True))
+
+    bind = op.get_bind()
+    texts = dict(bind.execute(sa.select(resumes.c.id, resumes.c.text)).all())
+
+    by_session = {}
+    for row in bind.execute(sa.select(answers).order_by(answers.c.session_id, answers.c.position)).mappings():
+        by_session.setdefault(row['session_id'], []).append(row)
+
+    updates = []
+    for session_id, resume_id, questions, score in bind.execute(
+        sa.select(sessions.c.id, sessions.c.resume_id, sessions.c.generated_questions, sessions.c.score)
+    ).all():
+        rows = by_session.get(session_id, [])
+        updates.append({
+            'session_id': session_id,
+            'old_resume_text': texts.get(resume_id, ''),
+            'old_user_answers': [{'question': r['question'], 'answer': r['answer']} for r in rows],
+            'old_feedback': {
+                'score': score,
+                'details': [
+                    {
+                        'score': r['score'],
+                        'breakdown': {
+                            'technical': r['technical'],
+                            'clarity': r['clarity'],
+                            'communication': r['communication'],
+                        },
+                        'why_lost': r['why_lost'] or [],
+                    }
+                    for r in rows
+                ],
+                'followup_questions': [
+                    {'question': r['question'], 'score': r['score'], 'followup_question': r['followup_question']}
+                    for r in rows
+                ],
+            } if score is not None else {},
+            'old_asked_questions': [_question_text(q) for q in questions or []],
+        })
+
+    values = {
+        'resume_text': sa.bindparam('old_resume_text'),
+        'user_answers': sa.bindparam('old_user_answers'),
+        'feedback': sa.bindparam('old_feedback'),
+    }
+    if restore_asked:
+        values['asked_questions'] = sa.bindparam('old_asked_questions')
+
+    for start in range(0, len(updates), BACKFILL_BATCH):
+        bind.execute(
+            sessions.update()
+            .where(sessions.c.id == sa.bindparam('session_id'))
+            .values(**values),
+            updates[start:start + BACKFILL_BATCH]
+        )
+
+    with op.batch_alter_table('interview_sessions') as batch_op:
+        batch_op.drop_index('ix_interview_sessions_resume_id')
+        batch_op.drop_constraint('fk_interview_sessions_resume_id', type_='foreignkey')
+        batch_op.drop_column('resume_id')
+
+    op.drop_index('ix_session_answers_session_position', table_name='session_answers')
+    op.drop_table('session_answers')
+    op.drop_table('resumes')
@@ -0,0 +1,71 @@
+import hashlib
+import os
+import sys
+import tempfile
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# the app modules build their engines at import time; tests never need a
+# live PostgreSQL server or preloaded models
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.gettempdir(), 'ai_interview_tests.db')}")
+os.environ.setdefault("MODEL_WARMUP", "lazy")
+
+
+STUB_DIM = 16
+
+
+class StubSentenceEncoder:
+    """
+    Deterministic stand-in for the MiniLM SentenceTransformer: every
+    whitespace token maps to a fixed pseudo-random vector, and the
+    sentence embedding is their mean.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def _tokens(self, text: str) -> np.ndarray:
+        rows = [
+            np.random.default_rng(int.from_bytes(hashlib.sha1(token.encode("utf-8")).digest()[:8], "little"))
+            .standard_normal(STUB_DIM)
+            for token in text.split() or [""]
+        ]
+        return np.asarray(rows, dtype=np.float32)
+
+    def encode(self, texts, output_value="sentence_embedding", normalize_embeddings=False, convert_to_numpy=True):
+        texts = list(texts)
+        self.calls.append(texts)
+        if output_value is None:
+            outputs = []
+            for text in texts:
+                tokens = self._tokens(text)
+                outputs.append({
+                    "token_embeddings": tokens,
+                    "attention_mask": np.ones(len(tokens), dtype=np.float32),
+                    "sentence_embedding": tokens.mean(axis=0),
+                })
+            return outputs
+
+        embeddings = np.stack([self._tokens(text).mean(axis=0) for text in texts])
+        if normalize_embeddings:
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings
+
+
+@pytest.fixture
+def stub_encoder(monkeypatch):
+    """
+    Registers StubSentenceEncoder as the loaded sentence model and gives
+    ml_scoring an empty, in-memory embedding cache and answer bank.
+    """
+    from app import ml_scoring, model_registry
+    from app.utils.answer_bank import IdealAnswerBank
+    from app.utils.embedding_cache import EmbeddingCache
+
+    encoder = StubSentenceEncoder()
+    monkeypatch.setitem(model_registry._models, model_registry.SENTENCE_MODEL, encoder)
+    monkeypatch.setattr(ml_scoring, "EMBEDDING_CACHE", EmbeddingCache())
+    monkeypatch.setattr(ml_scoring, "ANSWER_BANK", IdealAnswerBank("", model_registry.SCORING_MODEL))
+    return encoder
@@ -0,0 +1,19 @@
+"""
+The ONNX backend must score like PyTorch within the same tolerances the
+`python -m app.onnx_models` check enforces. Skipped unless
+optimum[onnxruntime] is installed; the first run exports the models.
+"""
+import os
+import pytest
+
+pytest.importorskip("optimum.onnxruntime")
+pytest.importorskip("sentence_transformers")
+
+from app.onnx_models import (
+    PARITY_DATA_PATH, PARITY_LIMIT, PARITY_MIN_COSINE, PARITY_MAX_SCORE_DIFF, check_parity
+)
+
+
+@pytest.mark.skipif(not os.path.exists(PARITY_DATA_PATH), reason="scoring dataset not available")
+def test_onnx_scores_match_torch():
+    assert check_parity(PARITY_DATA_PATH, PARITY_LIMIT, PARITY_MIN_COSINE, PARITY_MAX_SCORE_DIFF)
@@ -0,0 +1,16 @@
+import pytest
+from app.utils.reaction_channel import PostgresReactionBroker, psycopg2_dsn
+
+
+@pytest.mark.parametrize("url", [
+    "postgresql://app:s%40cret@db:5432/ai_interview",
+    "postgresql+psycopg2://app:s%40cret@db:5432/ai_interview",
+    "postgresql+asyncpg://app:s%40cret@db:5432/ai_interview",
+])
+def test_dsn_drops_the_driver_suffix(url):
+    assert psycopg2_dsn(url) == "postgresql://app:s%40cret@db:5432/ai_interview"
+
+
+def test_non_postgres_urls_are_rejected_up_front():
+    with pytest.raises(ValueError):
+        PostgresReactionBroker("sqlite:///./interview.db")
@@ -0,0 +1,61 @@
+import json
+import numpy as np
+import pytest
+from app import ml_scoring
+from app.ml_scoring import RegressionScorer, clean_text, encode_with_token_means, score_answers
+from app.model_registry import SENTENCE_MODEL
+
+ANSWER = (
+    "Polymorphism lets one interface, say Shape.area(), behave differently for "
+    "Circle, Square and Triangle objects - the caller never checks the concrete type!"
+)
+
+
+def write_weights(path, metadata=None):
+    weights = np.linspace(-1, 1, 16, dtype=np.float32)
+    arrays = {"weights": weights, "bias": np.float32(55.0)}
+    if metadata is not None:
+        arrays["metadata"] = np.array(json.dumps(metadata))
+    np.savez(path, **arrays)
+    return weights
+
+
+def expected_score(weights, text):
+    _, features = encode_with_token_means([text])
+    predicted = float(np.clip(features[0] @ weights + 55.0, 0, 100))
+    return min(10, max(0, int(round(predicted / 10))))
+
+
+@pytest.mark.parametrize("metadata, prepare", [
+    (None, lambda text: text),
+    ({"encoder": SENTENCE_MODEL, "feature": "token_mean", "preprocessing": "clean_text"}, clean_text),
+])
+def test_features_use_the_artifacts_preprocessing(tmp_path, monkeypatch, stub_encoder, metadata, prepare):
+    path = tmp_path / "weights.npz"
+    weights = write_weights(path, metadata)
+    scorer = RegressionScorer(str(path))
+    seen = []
+    predict = scorer.predict
+    monkeypatch.setattr(scorer, "predict", lambda features: seen.append(features) or predict(features))
+    monkeypatch.setattr(ml_scoring, "REGRESSION_SCORER", scorer)
+
+    [result] = score_answers([(ANSWER, ANSWER)], backend="regression")
+
+    _, expected = encode_with_token_means([prepare(ANSWER)])
+    _, other = encode_with_token_means([ANSWER if prepare is clean_text else clean_text(ANSWER)])
+    assert np.allclose(seen[0], expected)
+    assert not np.allclose(seen[0], other)
+    assert result["score"] == expected_score(weights, prepare(ANSWER))
+
+
+@pytest.mark.parametrize("metadata", [
+    {"encoder": "some-other-encoder", "feature": "token_mean", "preprocessing": "clean_text"},
+    {"encoder": SENTENCE_MODEL, "feature": "cls", "preprocessing": "clean_text"},
+    {"encoder": SENTENCE_MODEL, "feature": "token_mean", "preprocessing": "stemmed"},
+])
+def test_mismatched_artifacts_are_refused(tmp_path, metadata):
+    path = tmp_path / "weights.npz"
+    write_weights(path, metadata)
+
+    with pytest.raises(ValueError):
+        RegressionScorer(str(path)).predict(np.zeros((1, 16), dtype=np.float32))
@@ -0,0 +1,54 @@
+"""
+score_answers batches pairs into one encoder pass; it must score every pair
+exactly as score_answer does one at a time, whatever mix of too-short
+answers and cached or uncached ideal answers the batch holds.
+"""
+from app import ml_scoring
+from app.utils.embedding_cache import EmbeddingCache
+
+LONG = (
+    "I profiled the service under production load, found the slow database "
+    "queries, added the missing indexes and cached the hot lookups in memory {}"
+)
+CACHED_IDEALS = [
+    "Measure first, then index the slow queries and cache the hot reads.",
+    "Explain the trade-off between consistency and latency for the cache.",
+]
+UNCACHED_IDEALS = [
+    "Use a profiler to find the bottleneck before optimising anything.",
+    "Describe how the indexes were chosen and how the gain was measured.",
+]
+
+PAIRS = [
+    ("Too short to score.", CACHED_IDEALS[0]),
+    (LONG.format("first"), CACHED_IDEALS[0]),
+    (LONG.format("second"), UNCACHED_IDEALS[0]),
+    ("Indexes, mostly.", UNCACHED_IDEALS[1]),
+    (LONG.format("third"), CACHED_IDEALS[1]),
+    (LONG.format("fourth"), UNCACHED_IDEALS[1]),
+    # the same uncached ideal twice in one batch is encoded once
+    (LONG.format("fifth"), UNCACHED_IDEALS[0]),
+]
+
+
+def fresh_cache(monkeypatch, encoder):
+    texts = [ml_scoring.clean_text(text) for text in CACHED_IDEALS]
+    cache = EmbeddingCache()
+    cache.store(texts, encoder.encode(texts, normalize_embeddings=True))
+    monkeypatch.setattr(ml_scoring, "EMBEDDING_CACHE", cache)
+    return cache
+
+
+def test_batch_matches_single_scoring(monkeypatch, stub_encoder):
+    fresh_cache(monkeypatch, stub_encoder)
+    singles = [ml_scoring.score_answer(user, ideal) for user, ideal in PAIRS]
+
+    cache = fresh_cache(monkeypatch, stub_encoder)
+    stub_encoder.calls.clear()
+    batch = ml_scoring.score_answers(PAIRS)
+
+    assert batch == singles
+    assert batch[0] == batch[3] == ml_scoring.too_short_result()
+    assert cache.stats["hits"] == 2
+    # one pass: the five long answers plus the two distinct uncached ideals
+    assert len(stub_encoder.calls) == 1 and len(stub_encoder.calls[0]) == 7
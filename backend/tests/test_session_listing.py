@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal, engine
+from app.main import app
+from app.models import Base, InterviewSession
+
+USER_ID = 4242
+# three sessions per timestamp so pages split inside a run of equal created_at
+STAMPS = [datetime(2026, 1, 1) + timedelta(minutes=m) for m in (0, 0, 0, 5, 5, 5, 9)]
+
+
+@pytest.fixture(scope="module")
+def sessions():
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.query(InterviewSession).filter(InterviewSession.user_id == USER_ID).delete()
+        rows = [
+            InterviewSession(user_id=USER_ID, generated_questions=["q"] * (i + 1), created_at=stamp)
+            for i, stamp in enumerate(STAMPS)
+        ]
+        db.add_all(rows)
+        db.commit()
+        # no created_at: cannot be placed on the keyset, so never listed
+        undated = InterviewSession(user_id=USER_ID, generated_questions=[], created_at=None)
+        db.add(undated)
+        db.commit()
+        db.query(InterviewSession).filter(InterviewSession.id == undated.id).update({"created_at": None})
+        db.commit()
+        expected = [row.id for row in sorted(rows, key=lambda row: (row.created_at, row.id), reverse=True)]
+    yield expected
+    with SessionLocal() as db:
+        db.query(InterviewSession).filter(InterviewSession.user_id == USER_ID).delete()
+        db.commit()
+
+
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(app)
+
+
+def list_sessions(client, **params):
+    response = client.get(f"/interview/sessions/{USER_ID}", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 4])
+def test_pages_follow_created_at_then_id(client, sessions, limit):
+    seen, cursor = [], None
+    while True:
+        body = list_sessions(client, limit=limit, **({"cursor": cursor} if cursor else {}))
+        assert len(body["sessions"]) <= limit
+        seen += [session["id"] for session in body["sessions"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == sessions
+
+
+def test_last_page_has_no_cursor(client, sessions):
+    body = list_sessions(client, limit=len(sessions))
+    assert [session["id"] for session in body["sessions"]] == sessions
+    assert body["next_cursor"] is None
+    assert body["sessions"][0]["num_questions"] == len(STAMPS)
+
+
+@pytest.mark.parametrize("cursor", ["bad!", "bm90LWEtY3Vyc29y", "MjAyNi0wMS0wMXx4"])
+def test_malformed_cursor_is_rejected(client, sessions, cursor):
+    response = client.get(f"/interview/sessions/{USER_ID}", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_limit_is_capped(client, sessions):
+    assert len(list_sessions(client, limit=100)["sessions"]) == len(sessions)
+    assert client.get(f"/interview/sessions/{USER_ID}", params={"limit": 101}).status_code == 422
+    assert client.get(f"/interview/sessions/{USER_ID}", params={"limit": 0}).status_code == 422
@@ -1,5 +1,4 @@
 import { useState, useEffect } from 'react';
-import { getScoreProgress } from '../utils/api';
 import {
   uploadResume,
   getPreviousSessions,
@@ -15,6 +14,7 @@ export default function Dashboard() {
   const [interviewData, setInterviewData] = useState(null);
   const [interviewStarted, setInterviewStarted] = useState(false);
   const [sessions, setSessions] = useState([]);
+  const [sessionsCursor, setSessionsCursor] = useState(null);
   const [detailsOpen, setDetailsOpen] = useState(false);
   const [activeSessionId, setActiveSessionId] = useState(null);
   const [interviewResults, setInterviewResults] = useState(null);
@@ -29,10 +29,17 @@ export default function Dashboard() {
     if (userId) {
       getPreviousSessions(userId).then(data => {
         setSessions(data.sessions || []);
+        setSessionsCursor(data.next_cursor || null);
       });
     }
   }, [userId]);
 
+  const loadMoreSessions = async () => {
+    const data = await getPreviousSessions(userId, sessionsCursor);
+    setSessions(prev => [...prev, ...(data.sessions || [])]);
+    setSessionsCursor(data.next_cursor || null);
+  };
+
   const retakeInterview = async (sessionId) => {
     try {
       const data = await getSessionDetails(sessionId);
@@ -110,7 +117,7 @@ export default function Dashboard() {
         answers: answers.map(a => a.answer)
       };
 
-      const result = await scoreInterview(payload);
+      const result = await scoreInterview(payload, setScoreProgress);
       setInterviewResults(result);
 
       setInterviewStarted(false);
@@ -123,19 +130,6 @@ export default function Dashboard() {
     }
   };
 
-  useEffect(() => {
-    if (!scoring || !interviewData?.session_id) return;
-
-    const interval = setInterval(async () => {
-      try {
-        const data = await getScoreProgress(interviewData.session_id);
-        setScoreProgress(data);
-      } catch {}
-    }, 800);
-
-    return () => clearInterval(interval);
-  }, [scoring, interviewData?.session_id]);
-
 
   // SCORING LOADER
   if (scoring) {
@@ -459,6 +453,15 @@ export default function Dashboard() {
                     </div>
                   </div>
                 ))}
+
+                {sessionsCursor && (
+                  <button
+                    onClick={loadMoreSessions}
+                    className="w-full py-2 rounded-lg bg-white/10 border border-white/20 text-sm hover:bg-white/20 transition"
+                  >
+                    Load more
+                  </button>
+                )}
               </div>
             )}
           </div>
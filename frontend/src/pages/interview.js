@@ -1,5 +1,5 @@
 import { useState, useEffect, useRef } from 'react';
-import { getInterviewerReactions } from '../utils/api';
+import { subscribeInterviewerReactions } from '../utils/api';
 import { getLiveFollowup } from "../utils/api";
 
 export default function Interview({ questions, sessionId, onInterviewComplete }) {
@@ -106,16 +106,13 @@ export default function Interview({ questions, sessionId, onInterviewComplete })
   useEffect(() => {
     if (!sessionId) return;
 
-    const interval = setInterval(async () => {
-      try {
-        const res = await getInterviewerReactions(sessionId);
-        if (res.events?.length) {
-          setInterviewerReactions(res.events);
-        }
-      } catch {}
-    }, 1200);
+    const unsubscribe = subscribeInterviewerReactions(sessionId, (reaction) => {
+      setInterviewerReactions(prev =>
+        prev.some(r => r.seq === reaction.seq) ? prev : [...prev, reaction]
+      );
+    });
 
-    return () => clearInterval(interval);
+    return unsubscribe;
   }, [sessionId]);
 
   const handleSubmitAnswer = async () => {
@@ -126,18 +123,13 @@ export default function Interview({ questions, sessionId, onInterviewComplete })
     try {
      const result = await getLiveFollowup(
         currentQuestion,
-        currentAnswer
+        currentAnswer,
+        sessionId
       );
 
 
       setLiveFeedback(result);
       setShowFeedback(true);
-       if (result?.reaction?.text) {
-          setInterviewerReactions(prev => [
-            ...prev,
-            result.reaction
-          ]);
-        }
 
       if (result.followup_question) {
         setFollowup(result.followup_question);
@@ -49,8 +49,10 @@ export const uploadResume = async (formData) => {
 };
 
 // get previous questions
-export const getPreviousSessions = async (user_id) => {
-  const response = await api.get(`/interview/sessions/${user_id}`);
+export const getPreviousSessions = async (user_id, cursor = null) => {
+  const response = await api.get(`/interview/sessions/${user_id}`, {
+    params: cursor ? { cursor } : {}
+  });
   return response.data;
 };
 
@@ -66,24 +68,59 @@ export const getSessionDetails = async (sessionId) => {
   return response.data;
 }
 
-//for scoring answers
-export const scoreInterview = async (payload) => {
+//for scoring answers (queues a job, then streams per-answer results over SSE)
+export const scoreInterview = async (payload, onProgress) => {
   const response = await api.post("/interview/score-session", payload);
-  return response.data;
+  const { events_url } = response.data;
+
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(`${API_BASE_URL}${events_url}`);
+
+    source.addEventListener("result", (e) => {
+      const data = JSON.parse(e.data);
+      if (onProgress) onProgress({ current: data.current, total: data.total });
+    });
+
+    source.addEventListener("complete", (e) => {
+      source.close();
+      resolve(JSON.parse(e.data));
+    });
+
+    source.addEventListener("job_error", (e) => {
+      source.close();
+      reject(new Error(JSON.parse(e.data).detail));
+    });
+
+    // connection errors: EventSource reconnects on its own (the job replays
+    // its events), so only give up once the browser has closed the stream
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) {
+        reject(new Error("Scoring stream closed"));
+      }
+    };
+  });
 };
 
 
-//for getting interviewer reactions
-export async function getInterviewerReactions(sessionId) {
-  const res = await fetch(`/api/interview/interviewer-reactions/${sessionId}`);
-  return res.json();
+//for getting interviewer reactions (pushed over SSE, returns an unsubscribe function)
+export function subscribeInterviewerReactions(sessionId, onReaction) {
+  const source = new EventSource(
+    `${API_BASE_URL}/auth/interviewer-reactions/${sessionId}/stream`
+  );
+
+  source.addEventListener("reaction", (e) => {
+    onReaction(JSON.parse(e.data));
+  });
+
+  return () => source.close();
 }
 
 //Live Followup Questions
-export const getLiveFollowup = async (question, answer) => {
+export const getLiveFollowup = async (question, answer, sessionId) => {
   const res = await api.post("/interview/live-followup", {
     question,
-    answer
+    answer,
+    session_id: sessionId
   });
   return res.data;
 };